@@ -6,6 +6,7 @@ import { describe, it, expect } from 'vitest';
 import { calculateInfrastructureMetrics } from './infrastructure-burden.js';
 import { EnrichedParcel } from '../types/index.js';
 import { ZONING_RULES } from '../zoning/rules.js';
+import { calculateZoneMetrics } from './zone-metrics.js';
 
 describe('Infrastructure Burden Calculator', () => {
   describe('calculateInfrastructureMetrics', () => {
@@ -470,5 +471,40 @@ describe('Infrastructure Burden Calculator', () => {
         Math.round(mfAggregate.total_infrastructure_ft / mfAggregate.total_acres)
       );
     });
+
+    it('should produce the same result from precomputed zone metrics', () => {
+      const base: EnrichedParcel = {
+        parcel_id: '001',
+        address: '123 Main St',
+        zoning: 'SRA',
+        land_use_code: '130',
+        land_use_desc: 'SINGLE FAM',
+        total_value: 800000,
+        land_value: 400000,
+        parcel_area_acres: 1.0,
+        parcel_area_sqft: 43560,
+        building_footprint_sqft: 3000,
+        lot_coverage_pct: 6.9,
+        owner: 'John Doe',
+        account: 'A001',
+      };
+      const parcels: EnrichedParcel[] = [
+        base,
+        { ...base, parcel_id: '002', zoning: 'GRA', total_value: 1200000, parcel_area_acres: 0.35 },
+        { ...base, parcel_id: '003', zoning: 'GRA', total_value: 450000, parcel_area_acres: 0.2 },
+        { ...base, parcel_id: '004', zoning: 'UNKNOWN' },
+        { ...base, parcel_id: '005', zoning: null },
+      ];
+
+      const expected = calculateInfrastructureMetrics(parcels, ZONING_RULES);
+      const result = calculateInfrastructureMetrics(
+        parcels,
+        ZONING_RULES,
+        calculateZoneMetrics(parcels)
+      );
+
+      expect(result).toEqual(expected);
+      expect(Object.keys(result.zones)).toEqual(Object.keys(expected.zones));
+    });
   });
 });
@@ -11,6 +11,7 @@
 
 import { EnrichedParcel } from '../types/index.js';
 import { ZoneRules } from '../zoning/rules.js';
+import type { ZoneMetrics } from './zone-metrics.js';
 
 export interface ZoneInfrastructureMetrics {
   zone_name: string;
@@ -52,18 +53,29 @@ export interface AggregateMetrics {
 }
 
 /**
- * Calculate infrastructure burden metrics for each zone
+ * Residential zones that allow only single-family housing
  */
-export function calculateInfrastructureMetrics(
-  parcels: EnrichedParcel[],
-  zoneRules: Record<string, ZoneRules>
-): InfrastructureMetrics {
-  // Aggregate by zone
-  const zoneData: Record<string, {
-    total_acres: number;
-    total_value: number;
-    parcel_count: number;
-  }> = {};
+export const SINGLE_FAMILY_ZONES: readonly string[] = ['R', 'SRA', 'SRB'];
+
+/**
+ * Residential zones that also allow two- and multi-family housing
+ */
+export const MULTI_FAMILY_ZONES: readonly string[] = ['GRA', 'GRB', 'GRC'];
+
+/**
+ * Per-zone totals the infrastructure metrics are derived from
+ */
+interface ZoneTotals {
+  total_acres: number;
+  total_value: number;
+  parcel_count: number;
+}
+
+/**
+ * Sum acreage, value, and parcel count for each zone
+ */
+function aggregateByZone(parcels: EnrichedParcel[]): Record<string, ZoneTotals> {
+  const zoneData: Record<string, ZoneTotals> = {};
 
   for (const parcel of parcels) {
     if (!parcel || !parcel.zoning) {
@@ -71,30 +83,63 @@ export function calculateInfrastructureMetrics(
     }
 
     const zone = parcel.zoning;
-    const acres = parcel.parcel_area_acres;
-    const value = parcel.total_value;
 
-    if (!zoneData[zone]) {
-      zoneData[zone] = {
+    // One lookup per parcel; the accumulator is created on first sight of a zone
+    let data = zoneData[zone];
+    if (!data) {
+      data = {
         total_acres: 0,
         total_value: 0,
         parcel_count: 0,
       };
+      zoneData[zone] = data;
     }
 
-    zoneData[zone].total_acres += acres;
-    zoneData[zone].total_value += value;
-    zoneData[zone].parcel_count += 1;
+    data.total_acres += parcel.parcel_area_acres;
+    data.total_value += parcel.total_value;
+    data.parcel_count += 1;
+  }
+
+  return zoneData;
+}
+
+/**
+ * Take per-zone totals from already calculated zone metrics
+ */
+function totalsFromZoneMetrics(zoneMetrics: ZoneMetrics): Record<string, ZoneTotals> {
+  const zoneData: Record<string, ZoneTotals> = {};
+
+  for (const [zone, metrics] of Object.entries(zoneMetrics.zones)) {
+    zoneData[zone] = {
+      total_acres: metrics.totalAcres,
+      total_value: metrics.totalValue,
+      parcel_count: metrics.parcelCount,
+    };
   }
 
+  return zoneData;
+}
+
+/**
+ * Calculate infrastructure burden metrics for each zone
+ *
+ * @param parcels - Array of enriched parcels
+ * @param zoneRules - Zoning rules providing minimum lot size and frontage
+ * @param zoneMetrics - Zone metrics already calculated for the same parcels;
+ *   when given, zone totals are reused instead of re-aggregating the parcels
+ */
+export function calculateInfrastructureMetrics(
+  parcels: EnrichedParcel[],
+  zoneRules: Record<string, ZoneRules>,
+  zoneMetrics?: ZoneMetrics
+): InfrastructureMetrics {
+  // Aggregate by zone
+  const zoneData = zoneMetrics ? totalsFromZoneMetrics(zoneMetrics) : aggregateByZone(parcels);
+
   // Calculate metrics for each zone
   const zones: Record<string, ZoneInfrastructureMetrics> = {};
 
   for (const [zone, data] of Object.entries(zoneData)) {
-    if (!(zone in zoneRules)) {
-      continue;
-    }
-
     const rules = zoneRules[zone];
     if (!rules) {
       continue;
@@ -159,11 +204,8 @@ export function calculateInfrastructureMetrics(
   }
 
   // Calculate aggregate metrics for single-family vs multi-family zones
-  const sf_zones = ['R', 'SRA', 'SRB'];
-  const mf_zones = ['GRA', 'GRB', 'GRC'];
-
-  const sf_aggregate = calculateAggregateMetrics(zones, sf_zones);
-  const mf_aggregate = calculateAggregateMetrics(zones, mf_zones);
+  const sf_aggregate = calculateAggregateMetrics(zones, SINGLE_FAMILY_ZONES);
+  const mf_aggregate = calculateAggregateMetrics(zones, MULTI_FAMILY_ZONES);
 
   return {
     zones,
@@ -177,7 +219,7 @@ export function calculateInfrastructureMetrics(
  */
 function calculateAggregateMetrics(
   zones: Record<string, ZoneInfrastructureMetrics>,
-  zoneList: string[]
+  zoneList: readonly string[]
 ): AggregateMetrics {
   const aggregate = {
     total_parcels: 0,
@@ -188,17 +230,16 @@ function calculateAggregateMetrics(
   };
 
   for (const zone of zoneList) {
-    if (zone in zones) {
-      const data = zones[zone];
-      if (!data) {
-        continue;
-      }
-      aggregate.total_parcels += data.parcel_count;
-      aggregate.total_acres += data.total_acres;
-      aggregate.total_revenue += data.total_value;
-      aggregate.total_infrastructure_ft += data.estimated_linear_infrastructure_ft;
-      aggregate.total_infrastructure_cost += data.est_infrastructure_cost_per_parcel * data.parcel_count;
+    // Single lookup; zones with no parcels are simply absent
+    const data = zones[zone];
+    if (!data) {
+      continue;
     }
+    aggregate.total_parcels += data.parcel_count;
+    aggregate.total_acres += data.total_acres;
+    aggregate.total_revenue += data.total_value;
+    aggregate.total_infrastructure_ft += data.estimated_linear_infrastructure_ft;
+    aggregate.total_infrastructure_cost += data.est_infrastructure_cost_per_parcel * data.parcel_count;
   }
 
   // Calculate per-parcel and per-acre metrics
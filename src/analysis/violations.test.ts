@@ -223,6 +223,26 @@ describe('Zoning Violations Checker', () => {
       expect(useViolations).toHaveLength(0);
     });
 
+    it('should skip land use check when description is missing', () => {
+      const parcel: EnrichedParcel = {
+        parcel_id: '001',
+        address: '123 Main St',
+        zoning: 'SRA',
+        land_use_code: null,
+        land_use_desc: null,
+        total_value: 200000,
+        land_value: 200000,
+        parcel_area_acres: 1.0,
+        parcel_area_sqft: 43560,
+        building_footprint_sqft: 0,
+        lot_coverage_pct: 0,
+        owner: 'John Doe',
+        account: 'A001',
+      };
+
+      expect(checkZoningViolations(parcel)).toEqual([]);
+    });
+
     it('should use custom zone rules when provided', () => {
       const customRules: Record<string, ZoneRules> = {
         'TEST': {
@@ -259,6 +279,43 @@ describe('Zoning Violations Checker', () => {
       expect(violations).toHaveLength(1);
       expect(violations[0]?.type).toBe('undersized_lot');
     });
+
+    it('should reflect changes to allowed uses between checks', () => {
+      const customRules: Record<string, ZoneRules> = {
+        'TEST': {
+          name: 'Test Zone',
+          min_lot_size_sqft: null,
+          min_frontage_ft: null,
+          max_lot_coverage_pct: null,
+          min_open_space_pct: null,
+          front_setback_ft: null,
+          side_setback_ft: null,
+          rear_setback_ft: null,
+          allowed_uses: ['single_family'],
+        },
+      };
+
+      const parcel: EnrichedParcel = {
+        parcel_id: '001',
+        address: '123 Main St',
+        zoning: 'TEST',
+        land_use_code: '340',
+        land_use_desc: 'COMMERCIAL',
+        total_value: 500000,
+        land_value: 200000,
+        parcel_area_acres: 0.25,
+        parcel_area_sqft: 10890,
+        building_footprint_sqft: 0,
+        lot_coverage_pct: 0,
+        owner: 'John Doe',
+        account: 'A001',
+      };
+
+      expect(checkZoningViolations(parcel, customRules)).toHaveLength(1);
+
+      customRules['TEST']!.allowed_uses.push('commercial');
+      expect(checkZoningViolations(parcel, customRules)).toHaveLength(0);
+    });
   });
 
   describe('analyzeViolations', () => {
@@ -60,45 +60,42 @@ export function checkZoningViolations(
 ): Violation[] {
   const violations: Violation[] = [];
 
-  const zone = parcel.zoning;
-  if (!zone || !(zone in zoneRules)) {
-    return violations;
-  }
-
-  const rules = zoneRules[zone];
+  // Single lookup covers both missing zoning and unknown zones
+  const rules = parcel.zoning ? zoneRules[parcel.zoning] : undefined;
   if (!rules) {
     return violations;
   }
 
-  const land_use = classifyLandUse(parcel.land_use_desc || '');
-
-  // Check lot size
-  if (rules.min_lot_size_sqft !== null) {
-    if (parcel.parcel_area_sqft < rules.min_lot_size_sqft) {
-      violations.push({
-        type: 'undersized_lot',
-        severity: 'major',
-        description: `Lot size ${parcel.parcel_area_sqft.toFixed(0)} sqft is below minimum ${rules.min_lot_size_sqft} sqft`,
-        deficit: rules.min_lot_size_sqft - parcel.parcel_area_sqft,
-      });
-    }
+  // Check lot size (descriptions are only formatted when a violation fires)
+  const minLotSize = rules.min_lot_size_sqft;
+  const lotSize = parcel.parcel_area_sqft;
+  if (minLotSize !== null && lotSize < minLotSize) {
+    violations.push({
+      type: 'undersized_lot',
+      severity: 'major',
+      description: `Lot size ${lotSize.toFixed(0)} sqft is below minimum ${minLotSize} sqft`,
+      deficit: minLotSize - lotSize,
+    });
   }
 
   // Check lot coverage
-  if (rules.max_lot_coverage_pct !== null && parcel.lot_coverage_pct > 0) {
-    if (parcel.lot_coverage_pct > rules.max_lot_coverage_pct) {
-      violations.push({
-        type: 'excess_lot_coverage',
-        severity: 'major',
-        description: `Lot coverage ${parcel.lot_coverage_pct.toFixed(1)}% exceeds maximum ${rules.max_lot_coverage_pct}%`,
-        excess_pct: parcel.lot_coverage_pct - rules.max_lot_coverage_pct,
-      });
-    }
+  const maxCoverage = rules.max_lot_coverage_pct;
+  const coverage = parcel.lot_coverage_pct;
+  if (maxCoverage !== null && coverage > 0 && coverage > maxCoverage) {
+    violations.push({
+      type: 'excess_lot_coverage',
+      severity: 'major',
+      description: `Lot coverage ${coverage.toFixed(1)}% exceeds maximum ${maxCoverage}%`,
+      excess_pct: coverage - maxCoverage,
+    });
   }
 
-  // Check land use compatibility
-  if (rules.allowed_uses.length > 0 && land_use !== 'unknown' && land_use !== 'vacant') {
-    if (!rules.allowed_uses.includes(land_use)) {
+  // Check land use compatibility (only classify when the zone restricts uses
+  // and there is a description; a missing one classifies as 'unknown')
+  const description = parcel.land_use_desc;
+  if (description && rules.allowed_uses.length > 0) {
+    const land_use = classifyLandUse(description);
+    if (land_use !== 'unknown' && land_use !== 'vacant' && !rules.allowed_uses.includes(land_use)) {
       violations.push({
         type: 'incompatible_use',
         severity: 'critical',
@@ -140,34 +137,26 @@ export function analyzeViolations(parcels: EnrichedParcel[]): ViolationsAnalysis
     const violations = checkZoningViolations(parcel);
 
     if (violations.length > 0) {
-      const zone = parcel.zoning;
-      if (!zone) continue;
-
-      // Initialize zone data if needed
-      if (!(zone in violationsByZone)) {
-        violationsByZone[zone] = {
-          total_violations: 0,
-          undersized_lot_count: 0,
-          excess_coverage_count: 0,
-          incompatible_use_count: 0,
-          parcels_with_violations: [],
-          violations_by_parcel: {},
-        };
-      }
+      // Look up (or initialize) the zone entry once per parcel
+      const zoneData = (violationsByZone[parcel.zoning] ??= {
+        total_violations: 0,
+        undersized_lot_count: 0,
+        excess_coverage_count: 0,
+        incompatible_use_count: 0,
+        parcels_with_violations: [],
+        violations_by_parcel: {},
+      });
 
       // Track parcel
-      const zoneData = violationsByZone[zone];
-      if (!zoneData) continue;
-
       parcelsWithViolations.add(parcel.parcel_id);
       zoneData.parcels_with_violations.push(parcel.parcel_id);
       zoneData.violations_by_parcel[parcel.parcel_id] = violations;
 
       // Count violations
-      for (const violation of violations) {
-        totalViolations++;
-        zoneData.total_violations++;
+      totalViolations += violations.length;
+      zoneData.total_violations += violations.length;
 
+      for (const violation of violations) {
         // Update type-specific counts
         if (violation.type === 'undersized_lot') {
           zoneData.undersized_lot_count++;
@@ -183,6 +183,62 @@ describe('Zone Metrics Calculator', () => {
       expect(multiFam?.count).toBe(1);
     });
 
+    it('should combine descriptions that classify to the same land use', () => {
+      const parcels: EnrichedParcel[] = [
+        {
+          parcel_id: '001',
+          address: '1 Market St',
+          zoning: 'GRA',
+          land_use_code: '102',
+          land_use_desc: 'CONDO',
+          total_value: 500000,
+          land_value: 200000,
+          parcel_area_acres: 0.25,
+          parcel_area_sqft: 10890,
+          building_footprint_sqft: 2000,
+          lot_coverage_pct: 18.4,
+          owner: 'John Doe',
+          account: 'A001',
+        },
+        {
+          parcel_id: '002',
+          address: '2 Market St',
+          zoning: 'GRA',
+          land_use_code: '102',
+          land_use_desc: 'APARTMENT',
+          total_value: 500000,
+          land_value: 200000,
+          parcel_area_acres: 0.25,
+          parcel_area_sqft: 10890,
+          building_footprint_sqft: 2000,
+          lot_coverage_pct: 18.4,
+          owner: 'John Doe',
+          account: 'A002',
+        },
+        {
+          parcel_id: '003',
+          address: '3 Market St',
+          zoning: 'GRA',
+          land_use_code: '102',
+          land_use_desc: 'CONDO',
+          total_value: 500000,
+          land_value: 200000,
+          parcel_area_acres: 0.25,
+          parcel_area_sqft: 10890,
+          building_footprint_sqft: 2000,
+          lot_coverage_pct: 18.4,
+          owner: 'John Doe',
+          account: 'A003',
+        },
+      ];
+
+      const result = calculateZoneMetrics(parcels);
+
+      expect(result.zones['GRA']?.landUses).toEqual([
+        { landUse: 'multi_family', count: 3 },
+      ]);
+    });
+
     it('should skip parcels with missing zoning', () => {
       const parcels: EnrichedParcel[] = [
         {
@@ -41,35 +41,34 @@ export function calculateZoneMetrics(parcels: EnrichedParcel[]): ZoneMetrics {
       totalAcres: number;
       totalValue: number;
       parcelCount: number;
-      landUseCounts: Map<LandUseType, number>;
+      descriptionCounts: Map<string | null, number>;
     }
   >();
 
   for (const parcel of parcels) {
-    if (!parcel.zoning) {
+    const zone = parcel.zoning;
+    if (!zone) {
       continue;
     }
 
-    const zone = parcel.zoning;
-    const acres = parcel.parcel_area_acres;
-    const value = parcel.total_value;
-
-    if (!zoneData.has(zone)) {
-      zoneData.set(zone, {
+    let data = zoneData.get(zone);
+    if (!data) {
+      data = {
         totalAcres: 0,
         totalValue: 0,
         parcelCount: 0,
-        landUseCounts: new Map(),
-      });
+        descriptionCounts: new Map(),
+      };
+      zoneData.set(zone, data);
     }
 
-    const data = zoneData.get(zone)!;
-    data.totalAcres += acres;
-    data.totalValue += value;
+    data.totalAcres += parcel.parcel_area_acres;
+    data.totalValue += parcel.total_value;
     data.parcelCount += 1;
 
-    const landUse = classifyLandUse(parcel.land_use_desc);
-    data.landUseCounts.set(landUse, (data.landUseCounts.get(landUse) || 0) + 1);
+    // Group by raw description; classification happens once per distinct value below
+    const description = parcel.land_use_desc;
+    data.descriptionCounts.set(description, (data.descriptionCounts.get(description) ?? 0) + 1);
   }
 
   const zones: Record<string, ZoneMetricData> = {};
@@ -78,8 +77,15 @@ export function calculateZoneMetrics(parcels: EnrichedParcel[]): ZoneMetrics {
   for (const [zone, data] of zoneData.entries()) {
     const revenueDensity = data.totalAcres > 0 ? data.totalValue / data.totalAcres : 0;
 
+    // Descriptions are in first-seen order, so land uses keep their first-seen order too
+    const landUseCounts = new Map<LandUseType, number>();
+    for (const [description, count] of data.descriptionCounts) {
+      const landUse = classifyLandUse(description);
+      landUseCounts.set(landUse, (landUseCounts.get(landUse) ?? 0) + count);
+    }
+
     const landUses: ZoneLandUseBreakdown[] = Array.from(
-      data.landUseCounts.entries()
+      landUseCounts.entries()
     ).map(([landUse, count]) => ({
       landUse,
       count,
@@ -104,6 +104,7 @@ async function main(): Promise<void> {
   // - batchSize: Number of concurrent API requests (higher = faster, but respect rate limits)
   // - maxRequestsPerSecond: Rate limiting to avoid overwhelming API
   // - maxRetries: Retry attempts for transient failures
+  // - cacheDir: Responses from earlier runs are reused instead of re-fetched
 
   console.log('Stage 2: Configuring enrichment pipeline...');
 
@@ -111,6 +112,7 @@ async function main(): Promise<void> {
     batchSize: 20, // Process 20 parcels concurrently (matches Python performance)
     maxRequestsPerSecond: 10, // Respect API rate limits
     maxRetries: 3, // Retry transient failures
+    cacheDir: resolve(process.cwd(), '.cache', 'api'), // Reuse responses across runs
   });
 
   console.log('✓ Pipeline configured\n');
@@ -12,6 +12,7 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { MapGeoClient } from './mapgeo-client.js';
 import type { MapGeoResponse } from '../types/index.js';
+import type { ResponseCache } from './response-cache.js';
 
 describe('MapGeoClient', () => {
   let fetchMock: ReturnType<typeof vi.fn>;
@@ -112,6 +113,46 @@ describe('MapGeoClient', () => {
       );
     });
 
+    it('should discard the body of HTTP error responses', async () => {
+      const cancel = vi.fn().mockResolvedValue(undefined);
+      fetchMock.mockResolvedValueOnce({
+        ok: false,
+        status: 503,
+        statusText: 'Service Unavailable',
+        body: { cancel },
+      });
+
+      const client = new MapGeoClient({ maxRetries: 1 });
+
+      await expect(client.fetchParcelData('12345')).rejects.toThrow(/HTTP 503/);
+      expect(cancel).toHaveBeenCalledTimes(1);
+    });
+
+    it('should wait for Retry-After before retrying a 429 response', async () => {
+      const requestTimes: number[] = [];
+      fetchMock
+        .mockImplementationOnce(async () => {
+          requestTimes.push(Date.now());
+          return {
+            ok: false,
+            status: 429,
+            statusText: 'Too Many Requests',
+            headers: new Headers({ 'Retry-After': '2' }),
+          };
+        })
+        .mockImplementationOnce(async () => {
+          requestTimes.push(Date.now());
+          return { ok: true, json: async () => ({ data: { propID: '123' } }) };
+        });
+
+      const client = new MapGeoClient({ maxRetries: 2, maxRequestsPerSecond: 1000 });
+      const result = await client.fetchParcelData('123-456');
+
+      expect(result).toEqual({ data: { propID: '123' } });
+      // Retry-After (2s) outweighs the 1s exponential backoff
+      expect(requestTimes[1]! - requestTimes[0]!).toBeGreaterThanOrEqual(1950);
+    });
+
     it('should validate response structure', async () => {
       // Response missing 'data' field
       fetchMock.mockResolvedValueOnce({
@@ -261,6 +302,78 @@ describe('MapGeoClient', () => {
     });
   });
 
+  describe('caching', () => {
+    const cachedResponse: MapGeoResponse = {
+      data: { propID: '123-456', zoningCode: 'GRA', account: 'ACC123' },
+    };
+    const url = 'https://portsmouthnh.mapgeo.io/api/ui/datasets/properties/123-456';
+
+    it('should return cached responses without fetching', async () => {
+      const cache = { get: vi.fn().mockResolvedValue(cachedResponse), set: vi.fn() };
+      const client = new MapGeoClient({ cache: cache as unknown as ResponseCache });
+
+      const result = await client.fetchParcelData('123-456');
+
+      expect(result).toEqual(cachedResponse);
+      expect(cache.get).toHaveBeenCalledWith(url);
+      expect(fetchMock).not.toHaveBeenCalled();
+      expect(cache.set).not.toHaveBeenCalled();
+    });
+
+    it('should fetch and store responses on a cache miss', async () => {
+      const cache = {
+        get: vi.fn().mockResolvedValue(undefined),
+        set: vi.fn().mockResolvedValue(undefined),
+      };
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: async () => cachedResponse,
+      });
+
+      const client = new MapGeoClient({ cache: cache as unknown as ResponseCache });
+      const result = await client.fetchParcelData('123-456');
+
+      expect(result).toEqual(cachedResponse);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+      expect(cache.set).toHaveBeenCalledWith(url, cachedResponse);
+    });
+
+    it('should ignore invalid cached entries', async () => {
+      const cache = {
+        get: vi.fn().mockResolvedValue({ unexpected: true }),
+        set: vi.fn().mockResolvedValue(undefined),
+      };
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: async () => cachedResponse,
+      });
+
+      const client = new MapGeoClient({ cache: cache as unknown as ResponseCache });
+      const result = await client.fetchParcelData('123-456');
+
+      expect(result).toEqual(cachedResponse);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not fail the request when the cache write fails', async () => {
+      const cache = {
+        get: vi.fn().mockResolvedValue(undefined),
+        set: vi.fn().mockRejectedValue(new Error('EACCES')),
+      };
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: async () => cachedResponse,
+      });
+
+      const client = new MapGeoClient({ maxRetries: 1, cache: cache as unknown as ResponseCache });
+
+      await expect(client.fetchParcelData('123-456')).resolves.toEqual(cachedResponse);
+    });
+  });
+
   describe('configuration', () => {
     it('should use default configuration', () => {
       const client = new MapGeoClient();
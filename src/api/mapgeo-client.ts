@@ -2,12 +2,15 @@
  * Map Geo API Client
  *
  * Fetches geographic and property data from the Portsmouth MapGeo API.
- * Implements retry logic, rate limiting, and response validation.
+ * Implements retry logic, rate limiting, response validation, and optional
+ * on-disk caching of responses.
  *
  * API Endpoint: https://portsmouthnh.mapgeo.io/api/ui/datasets/properties/{parcelId}
  */
 
 import type { MapGeoResponse } from '../types/index.js';
+import type { ResponseCache } from './response-cache.js';
+import { RateLimiter, parseRetryAfter } from './rate-limiter.js';
 
 /**
  * Configuration options for MapGeoClient
@@ -36,6 +39,11 @@ export interface MapGeoClientConfig {
    * @default 15000
    */
   timeoutMs?: number;
+
+  /**
+   * Cache for responses; cached parcels are returned without a request
+   */
+  cache?: ResponseCache;
 }
 
 /**
@@ -44,32 +52,16 @@ export interface MapGeoClientConfig {
 export class MapGeoClient {
   private readonly baseUrl: string;
   private readonly maxRetries: number;
-  private readonly maxRequestsPerSecond: number;
   private readonly timeoutMs: number;
-  private lastRequestTime: number = 0;
-  private readonly minRequestInterval: number;
+  private readonly cache: ResponseCache | undefined;
+  private readonly rateLimiter: RateLimiter;
 
   constructor(config: MapGeoClientConfig = {}) {
     this.baseUrl = config.baseUrl ?? 'https://portsmouthnh.mapgeo.io/api/ui/datasets/properties';
     this.maxRetries = config.maxRetries ?? 3;
-    this.maxRequestsPerSecond = config.maxRequestsPerSecond ?? 10;
     this.timeoutMs = config.timeoutMs ?? 15000;
-    this.minRequestInterval = 1000 / this.maxRequestsPerSecond;
-  }
-
-  /**
-   * Enforces rate limiting by delaying requests if needed
-   */
-  private async enforceRateLimit(): Promise<void> {
-    const now = Date.now();
-    const timeSinceLastRequest = now - this.lastRequestTime;
-
-    if (timeSinceLastRequest < this.minRequestInterval) {
-      const delay = this.minRequestInterval - timeSinceLastRequest;
-      await new Promise(resolve => setTimeout(resolve, delay));
-    }
-
-    this.lastRequestTime = Date.now();
+    this.cache = config.cache;
+    this.rateLimiter = new RateLimiter(config.maxRequestsPerSecond ?? 10);
   }
 
   /**
@@ -102,37 +94,59 @@ export class MapGeoClient {
       throw new Error('Parcel ID cannot be empty');
     }
 
+    const url = `${this.baseUrl}/${encodeURIComponent(parcelId)}`;
+
+    // Serve from cache when possible (no request, no rate-limit delay)
+    const cached = await this.cache?.get(url);
+    if (cached !== undefined && this.isValidResponse(cached)) {
+      return cached;
+    }
+
     let lastError: Error | null = null;
 
     for (let attempt = 1; attempt <= this.maxRetries; attempt++) {
       try {
         // Enforce rate limiting before making request
-        await this.enforceRateLimit();
+        await this.rateLimiter.acquire();
 
-        const url = `${this.baseUrl}/${encodeURIComponent(parcelId)}`;
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), this.timeoutMs);
 
-        const response = await fetch(url, {
-          signal: controller.signal,
-          headers: {
-            'Accept': 'application/json',
-          },
-        });
-
-        clearTimeout(timeoutId);
-
-        if (!response.ok) {
-          throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        let data: unknown;
+        try {
+          const response = await fetch(url, {
+            signal: controller.signal,
+            headers: {
+              'Accept': 'application/json',
+            },
+          });
+
+          if (!response.ok) {
+            // Honour server back-pressure (429/503) before the next attempt
+            const retryAfterMs = parseRetryAfter(response.headers?.get('Retry-After'));
+            if (retryAfterMs !== null) {
+              this.rateLimiter.pauseFor(retryAfterMs);
+            }
+
+            // Discard the body so the keep-alive connection can be reused
+            await response.body?.cancel();
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+          }
+
+          data = await response.json();
+        } finally {
+          // Timeout covers reading the body, and is cleared even if fetch throws
+          clearTimeout(timeoutId);
         }
 
-        const data: unknown = await response.json();
-
         // Validate response structure
         if (!this.isValidResponse(data)) {
           throw new Error('Invalid response structure from Map Geo API');
         }
 
+        // A failed cache write should not fail an otherwise good fetch
+        await this.cache?.set(url, data).catch(() => undefined);
+
         return data;
 
       } catch (error) {
@@ -0,0 +1,132 @@
+/**
+ * Tests for request rate limiter
+ */
+
+import { describe, it, expect } from 'vitest';
+import { RateLimiter, parseRetryAfter } from './rate-limiter.js';
+
+describe('RateLimiter', () => {
+  it('should let the first request through immediately', async () => {
+    const limiter = new RateLimiter(1);
+    const start = Date.now();
+
+    await limiter.acquire();
+
+    expect(Date.now() - start).toBeLessThan(50);
+  });
+
+  it('should space sequential requests by the configured interval', async () => {
+    const limiter = new RateLimiter(10); // 100ms between requests
+    const times: number[] = [];
+
+    for (let i = 0; i < 3; i++) {
+      await limiter.acquire();
+      times.push(Date.now());
+    }
+
+    expect(times[1]! - times[0]!).toBeGreaterThanOrEqual(95);
+    expect(times[2]! - times[1]!).toBeGreaterThanOrEqual(95);
+  });
+
+  it('should space concurrent requests instead of releasing them together', async () => {
+    const limiter = new RateLimiter(20); // 50ms between requests
+    const start = Date.now();
+    const times: number[] = [];
+
+    await Promise.all(
+      Array.from({ length: 4 }, async () => {
+        await limiter.acquire();
+        times.push(Date.now() - start);
+      })
+    );
+
+    times.sort((a, b) => a - b);
+    expect(times[0]!).toBeLessThan(45);
+    expect(times[1]!).toBeGreaterThanOrEqual(45);
+    expect(times[2]!).toBeGreaterThanOrEqual(95);
+    expect(times[3]!).toBeGreaterThanOrEqual(145);
+  });
+
+  it('should not delay requests after an idle period', async () => {
+    const limiter = new RateLimiter(10);
+
+    await limiter.acquire();
+    await new Promise(resolve => setTimeout(resolve, 150));
+
+    const start = Date.now();
+    await limiter.acquire();
+
+    expect(Date.now() - start).toBeLessThan(50);
+  });
+});
+
+describe('RateLimiter.pauseFor', () => {
+  it('should hold back the next request until the pause ends', async () => {
+    const limiter = new RateLimiter(100);
+    await limiter.acquire();
+
+    limiter.pauseFor(150);
+
+    const start = Date.now();
+    await limiter.acquire();
+    expect(Date.now() - start).toBeGreaterThanOrEqual(140);
+  });
+
+  it('should hold back callers that were already waiting when the pause starts', async () => {
+    const limiter = new RateLimiter(10); // 100ms between requests
+    const start = Date.now();
+    const times: number[] = [];
+
+    const waiters = Array.from({ length: 5 }, async () => {
+      await limiter.acquire();
+      times.push(Date.now() - start);
+    });
+
+    await new Promise(resolve => setTimeout(resolve, 150));
+    limiter.pauseFor(300);
+    await Promise.all(waiters);
+
+    times.sort((a, b) => a - b);
+    // Two requests went out before the pause; the rest wait it out and
+    // are still spaced one interval apart afterwards
+    expect(times.filter(t => t >= 150 && t < 440)).toHaveLength(0);
+    expect(times.filter(t => t < 150)).toHaveLength(2);
+    expect(times[3]! - times[2]!).toBeGreaterThanOrEqual(95);
+    expect(times[4]! - times[3]!).toBeGreaterThanOrEqual(95);
+  });
+
+  it('should not shorten an existing wait', async () => {
+    const limiter = new RateLimiter(5); // 200ms between requests
+    await limiter.acquire();
+
+    limiter.pauseFor(10);
+
+    const start = Date.now();
+    await limiter.acquire();
+    expect(Date.now() - start).toBeGreaterThanOrEqual(190);
+  });
+});
+
+describe('parseRetryAfter', () => {
+  it('should parse delay-seconds values', () => {
+    expect(parseRetryAfter('2')).toBe(2000);
+    expect(parseRetryAfter(' 0 ')).toBe(0);
+  });
+
+  it('should parse HTTP-date values relative to now', () => {
+    const now = Date.parse('Wed, 14 Oct 2026 12:00:00 GMT');
+    expect(parseRetryAfter('Wed, 14 Oct 2026 12:00:05 GMT', now)).toBe(5000);
+    expect(parseRetryAfter('Wed, 14 Oct 2026 11:59:00 GMT', now)).toBe(0);
+  });
+
+  it('should cap long delays at one minute', () => {
+    expect(parseRetryAfter('3600')).toBe(60_000);
+  });
+
+  it('should return null for missing or invalid values', () => {
+    expect(parseRetryAfter(null)).toBeNull();
+    expect(parseRetryAfter(undefined)).toBeNull();
+    expect(parseRetryAfter('')).toBeNull();
+    expect(parseRetryAfter('soon')).toBeNull();
+  });
+});
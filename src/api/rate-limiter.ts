@@ -0,0 +1,107 @@
+/**
+ * Request Rate Limiter
+ *
+ * Spaces requests evenly at a maximum rate, and stays correct when many
+ * callers request a slot concurrently. Also honours server back-pressure
+ * signalled through the HTTP Retry-After header.
+ */
+
+/**
+ * Upper bound on how long a single Retry-After header may pause requests
+ */
+const MAX_RETRY_AFTER_MS = 60_000;
+
+/**
+ * Parses an HTTP Retry-After header value
+ *
+ * Accepts both forms allowed by RFC 9110: a number of seconds, or an HTTP
+ * date. The result is capped at one minute so a misbehaving server cannot
+ * stall the pipeline.
+ *
+ * @param value - Header value, if present
+ * @param now - Current time in milliseconds (for HTTP-date values)
+ * @returns Delay in milliseconds, or null if absent or unparseable
+ */
+export function parseRetryAfter(
+  value: string | null | undefined,
+  now: number = Date.now()
+): number | null {
+  if (!value || value.trim() === '') {
+    return null;
+  }
+
+  const trimmed = value.trim();
+  let delayMs: number;
+  if (/^\d+$/.test(trimmed)) {
+    delayMs = Number(trimmed) * 1000;
+  } else {
+    const date = Date.parse(trimmed);
+    if (isNaN(date)) {
+      return null;
+    }
+    delayMs = date - now;
+  }
+
+  return Math.min(Math.max(delayMs, 0), MAX_RETRY_AFTER_MS);
+}
+
+/**
+ * Rate limiter that hands out evenly spaced request slots
+ *
+ * Each call to acquire() reserves the next free slot synchronously, then
+ * waits until that slot arrives. Concurrent callers therefore queue up one
+ * interval apart instead of all observing the same "last request" time and
+ * firing together.
+ */
+export class RateLimiter {
+  private readonly intervalMs: number;
+  private nextSlot: number = 0;
+  private pausedUntil: number = 0;
+
+  /**
+   * @param maxRequestsPerSecond - Maximum requests per second
+   */
+  constructor(maxRequestsPerSecond: number) {
+    this.intervalMs = 1000 / maxRequestsPerSecond;
+  }
+
+  /**
+   * Reserves the next free slot and waits for it to arrive
+   */
+  private async waitForSlot(): Promise<void> {
+    const now = Date.now();
+    const slot = Math.max(now, this.nextSlot, this.pausedUntil);
+    this.nextSlot = slot + this.intervalMs;
+
+    const delay = slot - now;
+    if (delay > 0) {
+      await new Promise(resolve => setTimeout(resolve, delay));
+    }
+  }
+
+  /**
+   * Waits until the caller may send its next request
+   *
+   * A pause that starts while the caller is already waiting still applies:
+   * the caller gives up its slot and queues again after the pause.
+   */
+  async acquire(): Promise<void> {
+    await this.waitForSlot();
+    while (Date.now() < this.pausedUntil) {
+      await this.waitForSlot();
+    }
+  }
+
+  /**
+   * Holds back all further requests for a period (e.g. after a 429)
+   *
+   * Applies to callers already waiting in acquire() as well as new ones.
+   *
+   * @param delayMs - Milliseconds before the next request may be sent
+   */
+  pauseFor(delayMs: number): void {
+    const until = Date.now() + delayMs;
+    this.pausedUntil = Math.max(this.pausedUntil, until);
+    this.nextSlot = Math.max(this.nextSlot, until);
+  }
+}
@@ -0,0 +1,108 @@
+/**
+ * Tests for on-disk API response cache
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { ResponseCache } from './response-cache.js';
+import { mkdtempSync, readdirSync, rmSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+
+describe('ResponseCache', () => {
+  let cacheDir: string;
+
+  beforeEach(() => {
+    cacheDir = join(mkdtempSync(join(tmpdir(), 'response-cache-')), 'api');
+  });
+
+  afterEach(() => {
+    rmSync(join(cacheDir, '..'), { recursive: true, force: true });
+  });
+
+  it('should return undefined for missing entries', async () => {
+    const cache = new ResponseCache({ cacheDir });
+
+    expect(await cache.get('https://example.com/missing')).toBeUndefined();
+  });
+
+  it('should round-trip stored responses', async () => {
+    const cache = new ResponseCache({ cacheDir });
+    const data = { data: { id: '0123-0045-0000', totalValue: 500000 } };
+
+    await cache.set('https://example.com/0123-0045-0000', data);
+
+    expect(await cache.get('https://example.com/0123-0045-0000')).toEqual(data);
+  });
+
+  it('should persist entries across cache instances', async () => {
+    await new ResponseCache({ cacheDir }).set('key', { data: { id: '1' } });
+
+    const reopened = new ResponseCache({ cacheDir });
+    expect(await reopened.get('key')).toEqual({ data: { id: '1' } });
+  });
+
+  it('should treat expired entries as misses', async () => {
+    const cache = new ResponseCache({ cacheDir, maxAgeMs: 1000 });
+    await cache.set('key', { data: {} });
+
+    const [file] = readdirSync(cacheDir);
+    const stale = new Date(Date.now() - 5000).toISOString();
+    writeFileSync(join(cacheDir, file!), JSON.stringify({ cached_at: stale, data: {} }));
+
+    expect(await cache.get('key')).toBeUndefined();
+  });
+
+  it('should treat corrupt entries as misses', async () => {
+    const cache = new ResponseCache({ cacheDir });
+    await cache.set('key', { data: {} });
+
+    const [file] = readdirSync(cacheDir);
+    writeFileSync(join(cacheDir, file!), '{"cached_at": "2026-');
+
+    expect(await cache.get('key')).toBeUndefined();
+  });
+
+  it('should treat a null entry as a miss', async () => {
+    const cache = new ResponseCache({ cacheDir });
+    await cache.set('key', { data: {} });
+
+    const [file] = readdirSync(cacheDir);
+    writeFileSync(join(cacheDir, file!), 'null');
+
+    expect(await cache.get('key')).toBeUndefined();
+  });
+
+  it('should treat non-object entries and entries without a timestamp as misses', async () => {
+    const cache = new ResponseCache({ cacheDir });
+    await cache.set('key', { data: {} });
+
+    const [file] = readdirSync(cacheDir);
+    for (const content of ['42', '"text"', 'true', '{"data": {}}', '{"cached_at": 5, "data": {}}']) {
+      writeFileSync(join(cacheDir, file!), content);
+      expect(await cache.get('key')).toBeUndefined();
+    }
+  });
+
+  it('should handle concurrent writes of the same key', async () => {
+    const cache = new ResponseCache({ cacheDir });
+
+    const results = await Promise.allSettled(
+      [1, 2, 3].map(n => cache.set('key', { data: { n } }))
+    );
+
+    expect(results.every(result => result.status === 'fulfilled')).toBe(true);
+    expect(readdirSync(cacheDir)).toHaveLength(1);
+    const stored = (await cache.get('key')) as { data: { n: number } };
+    expect([1, 2, 3]).toContain(stored.data.n);
+  });
+
+  it('should not leave temporary files behind', async () => {
+    const cache = new ResponseCache({ cacheDir });
+    await cache.set('a', { data: {} });
+    await cache.set('b', { data: {} });
+
+    const files = readdirSync(cacheDir);
+    expect(files).toHaveLength(2);
+    expect(files.every(name => name.endsWith('.json'))).toBe(true);
+  });
+});
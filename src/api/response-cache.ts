@@ -0,0 +1,114 @@
+/**
+ * On-disk API Response Cache
+ *
+ * Stores API responses as JSON files so repeated runs can skip requests for
+ * parcels that were already fetched. Parcel data changes rarely, so entries
+ * are reused until they reach a configurable age.
+ *
+ * Each entry is written to `{cacheDir}/{sha256(key)}.json` as
+ * `{ "cached_at": <ISO timestamp>, "data": <response> }`.
+ */
+
+import { mkdir, readFile, rename, writeFile } from 'fs/promises';
+import { createHash, randomUUID } from 'crypto';
+import { resolve } from 'path';
+
+/**
+ * Configuration options for ResponseCache
+ */
+export interface ResponseCacheConfig {
+  /**
+   * Directory to store cached responses in (created on first write)
+   */
+  cacheDir: string;
+
+  /**
+   * Maximum age of a cached entry in milliseconds
+   * @default 604800000 (7 days)
+   */
+  maxAgeMs?: number;
+}
+
+interface CacheEntry {
+  cached_at: string;
+  data: unknown;
+}
+
+/**
+ * File-backed cache of API responses keyed by request URL
+ */
+export class ResponseCache {
+  private readonly cacheDir: string;
+  private readonly maxAgeMs: number;
+  private dirReady: Promise<unknown> | null = null;
+
+  constructor(config: ResponseCacheConfig) {
+    this.cacheDir = resolve(config.cacheDir);
+    this.maxAgeMs = config.maxAgeMs ?? 7 * 24 * 60 * 60 * 1000;
+  }
+
+  /**
+   * Returns the file path for a cache key
+   */
+  private entryPath(key: string): string {
+    const hash = createHash('sha256').update(key).digest('hex');
+    return resolve(this.cacheDir, `${hash}.json`);
+  }
+
+  /**
+   * Reads a cached response
+   *
+   * Missing, unreadable, malformed, or expired entries are treated as cache
+   * misses; this method never throws.
+   *
+   * @param key - Cache key (usually the request URL)
+   * @returns Cached response data, or undefined on a miss
+   */
+  async get(key: string): Promise<unknown> {
+    let entry: CacheEntry;
+    try {
+      const parsed: unknown = JSON.parse(await readFile(this.entryPath(key), 'utf-8'));
+      if (
+        !parsed ||
+        typeof parsed !== 'object' ||
+        typeof (parsed as Partial<CacheEntry>).cached_at !== 'string'
+      ) {
+        return undefined;
+      }
+      entry = parsed as CacheEntry;
+    } catch {
+      return undefined;
+    }
+
+    const cachedAt = Date.parse(entry.cached_at);
+    if (isNaN(cachedAt) || Date.now() - cachedAt > this.maxAgeMs) {
+      return undefined;
+    }
+
+    return entry.data;
+  }
+
+  /**
+   * Stores a response in the cache
+   *
+   * Writes to a temporary file and renames it into place so a concurrent
+   * reader or an interrupted run never sees a partial entry. Every write
+   * gets its own temporary file, so concurrent writes of the same key (e.g.
+   * duplicate parcel IDs fetched by different workers) do not collide; the
+   * last rename wins.
+   *
+   * @param key - Cache key (usually the request URL)
+   * @param data - JSON-serializable response data
+   */
+  async set(key: string, data: unknown): Promise<void> {
+    this.dirReady ??= mkdir(this.cacheDir, { recursive: true });
+    await this.dirReady;
+
+    const filePath = this.entryPath(key);
+    const tempPath = `${filePath}.${randomUUID()}.tmp`;
+    const entry: CacheEntry = { cached_at: new Date().toISOString(), data };
+
+    await writeFile(tempPath, JSON.stringify(entry), 'utf-8');
+    await rename(tempPath, filePath);
+  }
+}
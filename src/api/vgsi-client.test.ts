@@ -4,6 +4,7 @@
 
 import { describe, it, expect, beforeEach, vi, afterEach } from 'vitest';
 import { VGSIClient } from './vgsi-client.js';
+import type { ResponseCache } from './response-cache.js';
 
 describe('VGSIClient', () => {
   let client: VGSIClient;
@@ -108,6 +109,70 @@ describe('VGSIClient', () => {
       }
     });
 
+    it('should prefer building footprint over other area labels regardless of page order', async () => {
+      const mockHTML = `
+        <div>Gross Building: 4,000 sq ft</div>
+        <div>Total Building: 3,500 sq ft</div>
+        <div>Living Area: 2,500 SF</div>
+        <div>Building Footprint: 3,000 sq ft</div>
+      `;
+
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        text: async () => mockHTML,
+      });
+
+      const result = await client.fetchPropertyData('12345', 'PARCEL-001');
+
+      expect(result).toEqual({
+        living_area_sqft: 2500,
+        building_footprint_sqft: 3000,
+      });
+    });
+
+    it('should still match labels that appear between another label and its value', async () => {
+      const cases: Array<[string, Record<string, number>]> = [
+        [
+          'Gross Building Area Living Area: 1,200 SF then 3,000 sq ft',
+          { living_area_sqft: 1200, building_footprint_sqft: 3000 },
+        ],
+        [
+          'Building Footprint Living Area 1,100 SF xx 800 sq ft',
+          { living_area_sqft: 1100, building_footprint_sqft: 800 },
+        ],
+        [
+          'Living Area: 1,500 sq ft Building Footprint: 900 sq ft Lot 2,000 SF',
+          { living_area_sqft: 2000, building_footprint_sqft: 900 },
+        ],
+      ];
+
+      for (const [mockHTML, expected] of cases) {
+        fetchMock.mockResolvedValueOnce({
+          ok: true,
+          status: 200,
+          text: async () => mockHTML,
+        });
+
+        const result = await client.fetchPropertyData('12345', 'PARCEL-001');
+        expect(result).toEqual(expected);
+      }
+    });
+
+    it('should not attribute a distant figure to a label without a value', async () => {
+      const mockHTML = `<div>Living Area: not recorded</div>${'<span></span>'.repeat(30)}<div>Lot: 12,000 SF</div>`;
+
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        text: async () => mockHTML,
+      });
+
+      const result = await client.fetchPropertyData('12345', 'PARCEL-001');
+
+      expect(result).toEqual({});
+    });
+
     it('should return empty object when no building data is found', async () => {
       const mockHTML = '<html><body>No building data</body></html>';
 
@@ -341,6 +406,59 @@ describe('VGSIClient', () => {
     });
   });
 
+  describe('caching', () => {
+    const url = 'http://gis.vgsi.com/PortsmouthNH/Parcel.aspx?Pid=12345';
+
+    it('should return cached building data without fetching', async () => {
+      const cached = { living_area_sqft: 2500, building_footprint_sqft: 3000 };
+      const cache = { get: vi.fn().mockResolvedValue(cached), set: vi.fn() };
+      const cachedClient = new VGSIClient({ cache: cache as unknown as ResponseCache });
+
+      const result = await cachedClient.fetchPropertyData('12345', 'PARCEL-001');
+
+      expect(result).toEqual(cached);
+      expect(cache.get).toHaveBeenCalledWith(url);
+      expect(fetchMock).not.toHaveBeenCalled();
+    });
+
+    it('should store parsed data rather than HTML on a cache miss', async () => {
+      const cache = {
+        get: vi.fn().mockResolvedValue(undefined),
+        set: vi.fn().mockRejectedValue(new Error('EACCES')),
+      };
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        text: async () => '<div>Living Area: 1,800 SF</div>',
+      });
+
+      const cachedClient = new VGSIClient({ maxRetries: 1, cache: cache as unknown as ResponseCache });
+      const result = await cachedClient.fetchPropertyData('12345', 'PARCEL-001');
+
+      const expected = { living_area_sqft: 1800, building_footprint_sqft: 1800 };
+      expect(result).toEqual(expected);
+      expect(cache.set).toHaveBeenCalledWith(url, expected);
+    });
+
+    it('should not cache pages without any building metrics', async () => {
+      const cache = {
+        get: vi.fn().mockResolvedValue(undefined),
+        set: vi.fn().mockResolvedValue(undefined),
+      };
+      fetchMock.mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        text: async () => '<html><body>Site under maintenance</body></html>',
+      });
+
+      const cachedClient = new VGSIClient({ maxRetries: 1, cache: cache as unknown as ResponseCache });
+      const result = await cachedClient.fetchPropertyData('12345', 'PARCEL-001');
+
+      expect(result).toEqual({});
+      expect(cache.set).not.toHaveBeenCalled();
+    });
+  });
+
   describe('configuration', () => {
     it('should use default configuration when not provided', () => {
       const defaultClient = new VGSIClient();
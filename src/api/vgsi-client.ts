@@ -2,12 +2,42 @@
  * VGSI API Client
  *
  * Fetches property assessment and building data from the VGSI (Vision Government Solutions) API.
- * Implements retry logic, rate limiting, response validation, and HTML parsing.
+ * Implements retry logic, rate limiting, response validation, HTML parsing,
+ * and optional on-disk caching of parsed results.
  *
  * API Endpoint: http://gis.vgsi.com/PortsmouthNH/Parcel.aspx?Pid={accountNumber}
  */
 
 import type { VGSIResponse } from '../types/index.js';
+import type { ResponseCache } from './response-cache.js';
+import { RateLimiter, parseRetryAfter } from './rate-limiter.js';
+
+/**
+ * Single pattern covering every building metric on a VGSI parcel page
+ *
+ * Capture groups, in order:
+ * 1. Living area (SF)
+ * 2. Building footprint (sq ft)
+ * 3. Total building area (sq ft)
+ * 4. Gross building area (sq ft)
+ *
+ * Groups 2-4 are footprint candidates in order of preference. Matching them
+ * all in one global scan walks the page once instead of once per pattern.
+ *
+ * Each alternative is a lookahead, so a match consumes nothing and the scan
+ * moves on one character at a time. Another label sitting between a label
+ * and its figure (e.g. adjacent column headers) is therefore still tried,
+ * exactly as if each metric were searched for separately.
+ *
+ * The gap between a label and its figure is capped at 200 characters so a
+ * label without a nearby value fails fast instead of scanning the rest of
+ * the line, and cannot pick up an unrelated figure further down the page.
+ */
+const BUILDING_METRICS_PATTERN =
+  /(?=Living Area.{0,200}?(\d+,?\d*)\s*SF)|(?=Building Footprint.{0,200}?(\d+,?\d*)\s*sq\s*ft)|(?=Total Building.{0,200}?(\d+,?\d*)\s*sq\s*ft)|(?=Gross Building.{0,200}?(\d+,?\d*)\s*sq\s*ft)/gi;
+
+const LIVING_AREA_GROUP = 1;
+const FOOTPRINT_GROUPS = [2, 3, 4] as const;
 
 /**
  * Configuration options for VGSIClient
@@ -36,6 +66,11 @@ export interface VGSIClientConfig {
    * @default 15000
    */
   timeoutMs?: number;
+
+  /**
+   * Cache for parsed building data; cached accounts are returned without a request
+   */
+  cache?: ResponseCache;
 }
 
 /**
@@ -44,32 +79,16 @@ export interface VGSIClientConfig {
 export class VGSIClient {
   private readonly baseUrl: string;
   private readonly maxRetries: number;
-  private readonly maxRequestsPerSecond: number;
   private readonly timeoutMs: number;
-  private lastRequestTime: number = 0;
-  private readonly minRequestInterval: number;
+  private readonly rateLimiter: RateLimiter;
+  private readonly cache: ResponseCache | undefined;
 
   constructor(config: VGSIClientConfig = {}) {
     this.baseUrl = config.baseUrl ?? 'http://gis.vgsi.com/PortsmouthNH/Parcel.aspx';
     this.maxRetries = config.maxRetries ?? 3;
-    this.maxRequestsPerSecond = config.maxRequestsPerSecond ?? 10;
     this.timeoutMs = config.timeoutMs ?? 15000;
-    this.minRequestInterval = 1000 / this.maxRequestsPerSecond;
-  }
-
-  /**
-   * Enforces rate limiting by delaying requests if needed
-   */
-  private async enforceRateLimit(): Promise<void> {
-    const now = Date.now();
-    const timeSinceLastRequest = now - this.lastRequestTime;
-
-    if (timeSinceLastRequest < this.minRequestInterval) {
-      const delay = this.minRequestInterval - timeSinceLastRequest;
-      await new Promise(resolve => setTimeout(resolve, delay));
-    }
-
-    this.lastRequestTime = Date.now();
+    this.rateLimiter = new RateLimiter(config.maxRequestsPerSecond ?? 10);
+    this.cache = config.cache;
   }
 
   /**
@@ -92,36 +111,43 @@ export class VGSIClient {
    * - Living Area (square feet)
    * - Building Footprint (square feet)
    *
-   * Uses regex patterns to find building metrics in the HTML response.
+   * Scans the HTML once, keeping the first value found for each metric.
    * If no explicit footprint is found, uses living area as approximation.
    */
   private parseHTMLResponse(html: string): VGSIResponse {
     const buildingData: VGSIResponse = {};
 
-    // Extract living area using regex
-    const livingAreaMatch = html.match(/Living Area.*?(\d+,?\d*)\s*SF/i);
-    if (livingAreaMatch && livingAreaMatch[1]) {
-      const livingArea = parseFloat(livingAreaMatch[1].replace(/,/g, ''));
-      if (!isNaN(livingArea)) {
-        buildingData.living_area_sqft = livingArea;
+    // First value seen for each capture group, indexed by group number
+    const values: Array<number | undefined> = [];
+
+    for (const match of html.matchAll(BUILDING_METRICS_PATTERN)) {
+      const group = match.findIndex((captured, index) => index > 0 && captured !== undefined);
+      const captured = match[group];
+      if (group < 1 || !captured || values[group] !== undefined) {
+        continue;
+      }
+
+      const value = parseFloat(captured.replaceAll(',', ''));
+      if (!isNaN(value)) {
+        values[group] = value;
+      }
+
+      // Living area and the preferred footprint are all we need
+      if (values[LIVING_AREA_GROUP] !== undefined && values[FOOTPRINT_GROUPS[0]] !== undefined) {
+        break;
       }
     }
 
-    // Look for building footprint using multiple patterns
-    const footprintPatterns = [
-      /Building Footprint.*?(\d+,?\d*)\s*sq\s*ft/i,
-      /Total Building.*?(\d+,?\d*)\s*sq\s*ft/i,
-      /Gross Building.*?(\d+,?\d*)\s*sq\s*ft/i,
-    ];
-
-    for (const pattern of footprintPatterns) {
-      const match = html.match(pattern);
-      if (match && match[1]) {
-        const footprint = parseFloat(match[1].replace(/,/g, ''));
-        if (!isNaN(footprint)) {
-          buildingData.building_footprint_sqft = footprint;
-          break;
-        }
+    const livingArea = values[LIVING_AREA_GROUP];
+    if (livingArea !== undefined) {
+      buildingData.living_area_sqft = livingArea;
+    }
+
+    for (const group of FOOTPRINT_GROUPS) {
+      const footprint = values[group];
+      if (footprint !== undefined) {
+        buildingData.building_footprint_sqft = footprint;
+        break;
       }
     }
 
@@ -149,33 +175,62 @@ export class VGSIClient {
       throw new Error('Account number is required');
     }
 
-    await this.enforceRateLimit();
+    const url = `${this.baseUrl}?Pid=${encodeURIComponent(accountNumber)}`;
+
+    // Serve from cache when possible (no request, no rate-limit delay)
+    const cached = await this.cache?.get(url);
+    if (cached !== undefined && this.isValidResponse(cached)) {
+      return cached;
+    }
 
     let lastError: Error | null = null;
 
     for (let attempt = 1; attempt <= this.maxRetries; attempt++) {
       try {
+        // Every attempt is a request, so each one waits for a slot
+        await this.rateLimiter.acquire();
+
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), this.timeoutMs);
 
-        const url = `${this.baseUrl}?Pid=${encodeURIComponent(accountNumber)}`;
-        const response = await fetch(url, {
-          signal: controller.signal,
-        });
-
-        clearTimeout(timeoutId);
-
-        if (!response.ok) {
-          throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        let html: string;
+        try {
+          const response = await fetch(url, {
+            signal: controller.signal,
+          });
+
+          if (!response.ok) {
+            // Honour server back-pressure (429/503) before the next attempt
+            const retryAfterMs = parseRetryAfter(response.headers?.get('Retry-After'));
+            if (retryAfterMs !== null) {
+              this.rateLimiter.pauseFor(retryAfterMs);
+            }
+
+            // Discard the body so the keep-alive connection can be reused
+            await response.body?.cancel();
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+          }
+
+          html = await response.text();
+        } finally {
+          // Timeout covers reading the body, and is cleared even if fetch throws
+          clearTimeout(timeoutId);
         }
 
-        const html = await response.text();
         const parsedData = this.parseHTMLResponse(html);
 
         if (!this.isValidResponse(parsedData)) {
           throw new Error('Invalid response structure from VGSI API');
         }
 
+        // Cache the parsed result rather than the page, but only when it has
+        // a metric: an empty parse may be a maintenance or error page rather
+        // than a lot without buildings. A failed write should not fail an
+        // otherwise good fetch
+        if (Object.keys(parsedData).length > 0) {
+          await this.cache?.set(url, parsedData).catch(() => undefined);
+        }
+
         // Return parsed data even if empty (some parcels may have no building data)
         return parsedData;
       } catch (error) {
@@ -8,9 +8,12 @@
 
 import { readFile, writeFile } from 'fs/promises';
 import { EnrichedParcel } from './types/index.js';
-import { calculateZoneMetrics } from './analysis/zone-metrics.js';
-import { analyzeViolations } from './analysis/violations.js';
-import { calculateInfrastructureMetrics } from './analysis/infrastructure-burden.js';
+import { calculateZoneMetrics, type ZoneMetrics } from './analysis/zone-metrics.js';
+import { analyzeViolations, type ViolationsAnalysis } from './analysis/violations.js';
+import {
+  calculateInfrastructureMetrics,
+  type InfrastructureMetrics,
+} from './analysis/infrastructure-burden.js';
 import { ZONING_RULES } from './zoning/rules.js';
 import { generateComprehensiveReport } from './reports/comprehensive-report.js';
 import { generateInfrastructureReport } from './reports/infrastructure-report.js';
@@ -46,6 +49,18 @@ function getReadableTimestamp(): string {
   });
 }
 
+/**
+ * Write a generated report or JSON file and log its path
+ *
+ * @returns Path of the written file
+ */
+async function writeOutputFile(path: string, content: string): Promise<string> {
+  await writeFile(path, content, 'utf-8');
+  console.log(`✓ Written: ${path}`);
+  console.log('');
+  return path;
+}
+
 /**
  * Parse CLI arguments
  */
@@ -108,72 +123,53 @@ async function generateReports() {
 
   const generatedFiles: string[] = [];
 
-  // Infrastructure-only mode
+  // --infrastructure-only takes precedence if both flags are given
+  const includeViolations = !infrastructureOnly;
+  const includeInfrastructure = infrastructureOnly || !violationsOnly;
+
   if (infrastructureOnly) {
     console.log('Mode: Infrastructure burden report only');
-    console.log('');
-
-    // Calculate infrastructure burden
-    console.log('Calculating infrastructure burden...');
-    const infrastructureMetrics = calculateInfrastructureMetrics(validParcels, ZONING_RULES);
-    const infraZoneCount = Object.keys(infrastructureMetrics.zones).length;
-    console.log(`✓ Calculated infrastructure metrics for ${infraZoneCount} zones`);
-    console.log('');
-
-    // Generate infrastructure report
-    console.log('Generating infrastructure burden report...');
-    const infrastructureReport = generateInfrastructureReport(
-      infrastructureMetrics,
-      readableTimestamp
-    );
-    const infrastructureReportPath = `${OUTPUT_DIR}/Portsmouth_Infrastructure_Burden_${timestamp}.txt`;
-    await writeFile(infrastructureReportPath, infrastructureReport, 'utf-8');
-    console.log(`✓ Written: ${infrastructureReportPath}`);
-    console.log('');
-    generatedFiles.push(infrastructureReportPath);
-
-    // Write infrastructure JSON
-    const infrastructureJsonPath = `${OUTPUT_DIR}/infrastructure_metrics.json`;
-    await writeFile(infrastructureJsonPath, JSON.stringify(infrastructureMetrics, null, 2), 'utf-8');
-    console.log(`✓ Written: ${infrastructureJsonPath}`);
-    console.log('');
-    generatedFiles.push(infrastructureJsonPath);
-
-    // Summary
-    console.log('='.repeat(60));
-    console.log('Report Generation Complete');
-    console.log('='.repeat(60));
-    console.log('');
-    console.log('Generated Reports:');
-    generatedFiles.forEach(file => console.log(`  • ${file}`));
-    console.log('');
-    console.log('Summary Statistics:');
-    console.log(`  • Total parcels analyzed: ${validParcels.length.toLocaleString()}`);
-    console.log(`  • Parcels skipped: ${skippedCount.toLocaleString()}`);
-    console.log(`  • Zones analyzed: ${infraZoneCount}`);
-    console.log('');
-    return;
+  } else if (violationsOnly) {
+    console.log('Mode: Violations report only');
+  } else {
+    console.log('Mode: All reports');
   }
+  console.log('');
 
-  // Violations-only mode
-  if (violationsOnly) {
-    console.log('Mode: Violations report only');
-    console.log('');
+  // Each analysis runs once, and only if a selected report needs it
+  let zoneMetrics: ZoneMetrics | null = null;
+  let violationsAnalysis: ViolationsAnalysis | null = null;
+  let infrastructureMetrics: InfrastructureMetrics | null = null;
 
+  if (includeViolations) {
     // Calculate zone metrics (needed for comprehensive report)
     console.log('Calculating zone metrics...');
-    const zoneMetrics = calculateZoneMetrics(validParcels);
-    const zoneCount = Object.keys(zoneMetrics.zones).length;
-    console.log(`✓ Calculated metrics for ${zoneCount} zones`);
+    zoneMetrics = calculateZoneMetrics(validParcels);
+    console.log(`✓ Calculated metrics for ${Object.keys(zoneMetrics.zones).length} zones`);
     console.log('');
 
     // Analyze violations
     console.log('Analyzing zoning violations...');
-    const violationsAnalysis = analyzeViolations(validParcels);
+    violationsAnalysis = analyzeViolations(validParcels);
     console.log(`✓ Found ${violationsAnalysis.total_violations.toLocaleString()} violations`);
     console.log(`  ${violationsAnalysis.total_parcels_with_violations.toLocaleString()} parcels affected`);
     console.log('');
+  }
+
+  if (includeInfrastructure) {
+    // Calculate infrastructure burden
+    console.log('Calculating infrastructure burden...');
+    // Reuse zone totals from the zone metrics pass when it has run
+    infrastructureMetrics = calculateInfrastructureMetrics(
+      validParcels,
+      ZONING_RULES,
+      zoneMetrics ?? undefined
+    );
+    console.log(`✓ Calculated infrastructure metrics for ${Object.keys(infrastructureMetrics.zones).length} zones`);
+    console.log('');
+  }
 
+  if (zoneMetrics && violationsAnalysis) {
     // Generate comprehensive report
     console.log('Generating comprehensive report...');
     const comprehensiveReport = generateComprehensiveReport(
@@ -182,101 +178,35 @@ async function generateReports() {
       validParcels.length,
       readableTimestamp
     );
-    const comprehensiveReportPath = `${OUTPUT_DIR}/Portsmouth_Zoning_Report_${timestamp}.txt`;
-    await writeFile(comprehensiveReportPath, comprehensiveReport, 'utf-8');
-    console.log(`✓ Written: ${comprehensiveReportPath}`);
-    console.log('');
-    generatedFiles.push(comprehensiveReportPath);
+    generatedFiles.push(
+      await writeOutputFile(`${OUTPUT_DIR}/Portsmouth_Zoning_Report_${timestamp}.txt`, comprehensiveReport)
+    );
 
     // Write violations JSON
-    const violationsJsonPath = `${OUTPUT_DIR}/violations_analysis.json`;
-    await writeFile(violationsJsonPath, JSON.stringify(violationsAnalysis, null, 2), 'utf-8');
-    console.log(`✓ Written: ${violationsJsonPath}`);
-    console.log('');
-    generatedFiles.push(violationsJsonPath);
-
-    // Summary
-    console.log('='.repeat(60));
-    console.log('Report Generation Complete');
-    console.log('='.repeat(60));
-    console.log('');
-    console.log('Generated Reports:');
-    generatedFiles.forEach(file => console.log(`  • ${file}`));
-    console.log('');
-    console.log('Summary Statistics:');
-    console.log(`  • Total parcels analyzed: ${validParcels.length.toLocaleString()}`);
-    console.log(`  • Parcels skipped: ${skippedCount.toLocaleString()}`);
-    console.log(`  • Zones analyzed: ${zoneCount}`);
-    console.log(`  • Total violations found: ${violationsAnalysis.total_violations.toLocaleString()}`);
-    console.log(`  • Parcels with violations: ${violationsAnalysis.total_parcels_with_violations.toLocaleString()}`);
-    console.log('');
-    return;
+    generatedFiles.push(
+      await writeOutputFile(`${OUTPUT_DIR}/violations_analysis.json`, JSON.stringify(violationsAnalysis, null, 2))
+    );
   }
 
-  // Default: Generate all reports
-  console.log('Mode: All reports');
-  console.log('');
-
-  // Calculate zone metrics
-  console.log('Calculating zone metrics...');
-  const zoneMetrics = calculateZoneMetrics(validParcels);
-  const zoneCount = Object.keys(zoneMetrics.zones).length;
-  console.log(`✓ Calculated metrics for ${zoneCount} zones`);
-  console.log('');
-
-  // Analyze violations
-  console.log('Analyzing zoning violations...');
-  const violationsAnalysis = analyzeViolations(validParcels);
-  console.log(`✓ Found ${violationsAnalysis.total_violations.toLocaleString()} violations`);
-  console.log(`  ${violationsAnalysis.total_parcels_with_violations.toLocaleString()} parcels affected`);
-  console.log('');
-
-  // Calculate infrastructure burden
-  console.log('Calculating infrastructure burden...');
-  const infrastructureMetrics = calculateInfrastructureMetrics(validParcels, ZONING_RULES);
-  const infraZoneCount = Object.keys(infrastructureMetrics.zones).length;
-  console.log(`✓ Calculated infrastructure metrics for ${infraZoneCount} zones`);
-  console.log('');
-
-  // Generate comprehensive report
-  console.log('Generating comprehensive report...');
-  const comprehensiveReport = generateComprehensiveReport(
-    zoneMetrics,
-    violationsAnalysis,
-    validParcels.length,
-    readableTimestamp
-  );
-  const comprehensiveReportPath = `${OUTPUT_DIR}/Portsmouth_Zoning_Report_${timestamp}.txt`;
-  await writeFile(comprehensiveReportPath, comprehensiveReport, 'utf-8');
-  console.log(`✓ Written: ${comprehensiveReportPath}`);
-  console.log('');
-  generatedFiles.push(comprehensiveReportPath);
-
-  // Write violations JSON
-  const violationsJsonPath = `${OUTPUT_DIR}/violations_analysis.json`;
-  await writeFile(violationsJsonPath, JSON.stringify(violationsAnalysis, null, 2), 'utf-8');
-  console.log(`✓ Written: ${violationsJsonPath}`);
-  console.log('');
-  generatedFiles.push(violationsJsonPath);
+  if (infrastructureMetrics) {
+    // Generate infrastructure report
+    console.log('Generating infrastructure burden report...');
+    const infrastructureReport = generateInfrastructureReport(
+      infrastructureMetrics,
+      readableTimestamp
+    );
+    generatedFiles.push(
+      await writeOutputFile(`${OUTPUT_DIR}/Portsmouth_Infrastructure_Burden_${timestamp}.txt`, infrastructureReport)
+    );
 
-  // Generate infrastructure report
-  console.log('Generating infrastructure burden report...');
-  const infrastructureReport = generateInfrastructureReport(
-    infrastructureMetrics,
-    readableTimestamp
-  );
-  const infrastructureReportPath = `${OUTPUT_DIR}/Portsmouth_Infrastructure_Burden_${timestamp}.txt`;
-  await writeFile(infrastructureReportPath, infrastructureReport, 'utf-8');
-  console.log(`✓ Written: ${infrastructureReportPath}`);
-  console.log('');
-  generatedFiles.push(infrastructureReportPath);
+    // Write infrastructure JSON
+    generatedFiles.push(
+      await writeOutputFile(`${OUTPUT_DIR}/infrastructure_metrics.json`, JSON.stringify(infrastructureMetrics, null, 2))
+    );
+  }
 
-  // Write infrastructure JSON
-  const infrastructureJsonPath = `${OUTPUT_DIR}/infrastructure_metrics.json`;
-  await writeFile(infrastructureJsonPath, JSON.stringify(infrastructureMetrics, null, 2), 'utf-8');
-  console.log(`✓ Written: ${infrastructureJsonPath}`);
-  console.log('');
-  generatedFiles.push(infrastructureJsonPath);
+  // Zone count comes from zone metrics when available, as in the full report
+  const zoneCount = Object.keys((zoneMetrics ?? infrastructureMetrics)?.zones ?? {}).length;
 
   // Summary
   console.log('='.repeat(60));
@@ -290,8 +220,10 @@ async function generateReports() {
   console.log(`  • Total parcels analyzed: ${validParcels.length.toLocaleString()}`);
   console.log(`  • Parcels skipped: ${skippedCount.toLocaleString()}`);
   console.log(`  • Zones analyzed: ${zoneCount}`);
-  console.log(`  • Total violations found: ${violationsAnalysis.total_violations.toLocaleString()}`);
-  console.log(`  • Parcels with violations: ${violationsAnalysis.total_parcels_with_violations.toLocaleString()}`);
+  if (violationsAnalysis) {
+    console.log(`  • Total violations found: ${violationsAnalysis.total_violations.toLocaleString()}`);
+    console.log(`  • Parcels with violations: ${violationsAnalysis.total_parcels_with_violations.toLocaleString()}`);
+  }
   console.log('');
 }
 
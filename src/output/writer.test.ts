@@ -70,6 +70,64 @@ describe('Output Writer', () => {
       expect(content.parcels[0].parcel_id).toBe('R001-001');
     });
 
+    it('writes one parcel per line', () => {
+      const base: EnrichedParcel = {
+        parcel_id: 'R001-001',
+        address: '123 Main St',
+        zoning: 'GRA',
+        land_use_code: '101',
+        land_use_desc: 'Single Family',
+        total_value: 500000,
+        land_value: 200000,
+        parcel_area_acres: 0.25,
+        parcel_area_sqft: 10890,
+        building_footprint_sqft: 0,
+        lot_coverage_pct: 0,
+        owner: 'John Doe',
+        account: '12345',
+      };
+      const parcels = [base, { ...base, parcel_id: 'R001-002' }, { ...base, parcel_id: 'R001-003' }];
+
+      const filePath = writeEnrichedParcels(parcels, TEST_OUTPUT_DIR);
+      const text = readFileSync(filePath, 'utf-8');
+
+      const parcelLines = text.split('\n').filter(line => line.includes('"parcel_id"'));
+      expect(parcelLines).toHaveLength(3);
+      expect(JSON.parse(parcelLines[0]!.trim().replace(/,$/, ''))).toEqual(base);
+
+      const content = JSON.parse(text);
+      expect(content.parcels).toEqual(parcels);
+      expect(content.metadata.parcel_count).toBe(3);
+    });
+
+    it('writes valid JSON, including non-ASCII text, when output spans several write chunks', () => {
+      const parcels = Array.from({ length: 1000 }, (_, i): EnrichedParcel => ({
+        parcel_id: `R001-${String(i).padStart(4, '0')}`,
+        address: `${i} Main St`,
+        zoning: 'GRA',
+        land_use_code: '101',
+        land_use_desc: 'Single Family',
+        total_value: 500000,
+        land_value: 200000,
+        parcel_area_acres: 0.25,
+        parcel_area_sqft: 10890,
+        building_footprint_sqft: 0,
+        lot_coverage_pct: 0,
+        owner: i % 2 === 0 ? 'John Doe' : 'José Núñez – Trustee',
+        account: String(i),
+      }));
+
+      const filePath = writeEnrichedParcels(parcels, TEST_OUTPUT_DIR);
+      const text = readFileSync(filePath, 'utf-8');
+
+      // Well past one 64 KB write chunk
+      expect(Buffer.byteLength(text)).toBeGreaterThan(3 * 64 * 1024);
+
+      const content = JSON.parse(text);
+      expect(content.parcels).toEqual(parcels);
+      expect(content.metadata.parcel_count).toBe(parcels.length);
+    });
+
     it('handles empty parcel array', () => {
       const filePath = writeEnrichedParcels([], TEST_OUTPUT_DIR);
 
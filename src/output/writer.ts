@@ -11,7 +11,7 @@
  * - analysis_summary.json: Statistics and metadata about the run
  */
 
-import { writeFileSync, mkdirSync, existsSync } from 'fs';
+import { writeFileSync, mkdirSync, existsSync, openSync, writeSync, closeSync } from 'fs';
 import { resolve } from 'path';
 import type { EnrichedParcel, APIError, EnrichmentSummary } from '../types/index.js';
 import type { LoadParcelsResult } from '../parsers/csv-parser.js';
@@ -30,9 +30,83 @@ function ensureOutputDirectory(): string {
   return outputDir;
 }
 
+/**
+ * Approximate number of characters buffered before each write to disk
+ */
+const WRITE_CHUNK_SIZE = 64 * 1024;
+
+/**
+ * Write a string to an open file descriptor in full
+ *
+ * writeSync may write fewer bytes than requested, so keep writing the
+ * remainder until the whole buffer is on disk.
+ */
+function writeFully(fd: number, text: string): void {
+  const buffer = Buffer.from(text, 'utf-8');
+  let offset = 0;
+  while (offset < buffer.length) {
+    offset += writeSync(fd, buffer, offset, buffer.length - offset);
+  }
+}
+
+/**
+ * Write an object as JSON with one array element per line
+ *
+ * Top-level fields are indented like JSON.stringify(value, null, 2), but
+ * each record in `records` is written compactly on its own line. The result
+ * is still a single JSON document, is much smaller than fully indented
+ * output, and can be processed line by line.
+ *
+ * Records are serialized and flushed to the file in chunks, so the full
+ * document is never held in memory as a single string.
+ *
+ * @param filePath - File to write
+ * @param fields - Top-level fields written before the records
+ * @param recordsKey - Name of the top-level array field
+ * @param records - Records to write one per line
+ */
+function writeRecordsPerLine(
+  filePath: string,
+  fields: Record<string, unknown>,
+  recordsKey: string,
+  records: readonly unknown[]
+): void {
+  const fd = openSync(filePath, 'w');
+
+  try {
+    let chunk = '{\n';
+
+    for (const [key, value] of Object.entries(fields)) {
+      const json = JSON.stringify(value, null, 2).replace(/\n/g, '\n  ');
+      chunk += `  ${JSON.stringify(key)}: ${json},\n`;
+    }
+
+    if (records.length === 0) {
+      chunk += `  ${JSON.stringify(recordsKey)}: []\n`;
+    } else {
+      chunk += `  ${JSON.stringify(recordsKey)}: [\n`;
+      const last = records.length - 1;
+      records.forEach((record, index) => {
+        chunk += `    ${JSON.stringify(record)}${index < last ? ',' : ''}\n`;
+        if (chunk.length >= WRITE_CHUNK_SIZE) {
+          writeFully(fd, chunk);
+          chunk = '';
+        }
+      });
+      chunk += '  ]\n';
+    }
+
+    writeFully(fd, chunk + '}');
+  } finally {
+    closeSync(fd);
+  }
+}
+
 /**
  * Write enriched parcels to JSON file
  *
+ * Parcels are written one per line (see writeRecordsPerLine).
+ *
  * @param parcels - Array of successfully enriched parcels
  * @param outputDir - Directory to write file to
  * @returns Path to written file
@@ -40,21 +114,18 @@ function ensureOutputDirectory(): string {
 export function writeEnrichedParcels(parcels: EnrichedParcel[], outputDir: string): string {
   const filePath = resolve(outputDir, 'portsmouth_properties_full.json');
 
-  const output = {
-    metadata: {
-      description: 'Portsmouth parcel data enriched from State GIS, Map Geo API, and VGSI API',
-      generated_at: new Date().toISOString(),
-      parcel_count: parcels.length,
-      data_sources: [
-        'Portsmouth_Parcels.csv (State GIS)',
-        'Map Geo API (portsmouthnh.mapgeo.io)',
-        'VGSI API (gis.vgsi.com)',
-      ],
-    },
-    parcels,
+  const metadata = {
+    description: 'Portsmouth parcel data enriched from State GIS, Map Geo API, and VGSI API',
+    generated_at: new Date().toISOString(),
+    parcel_count: parcels.length,
+    data_sources: [
+      'Portsmouth_Parcels.csv (State GIS)',
+      'Map Geo API (portsmouthnh.mapgeo.io)',
+      'VGSI API (gis.vgsi.com)',
+    ],
   };
 
-  writeFileSync(filePath, JSON.stringify(output, null, 2), 'utf-8');
+  writeRecordsPerLine(filePath, { metadata }, 'parcels', parcels);
 
   return filePath;
 }
@@ -23,9 +23,48 @@ export interface LoadParcelsResult {
   }>;
 }
 
+/**
+ * ParcelRecord fields, read from the CSV column of the same name
+ */
+const PARCEL_FIELDS = [
+  'town',
+  'slum',
+  'localnbc',
+  'pid',
+  'townid',
+  'nbc',
+  'oid_1',
+  'sluc',
+  'u_id',
+  'countyid',
+  'name',
+  'streetaddress',
+  'parceloid',
+  'nh_gis_id',
+  'displayid',
+  'SHAPE__Length',
+  'slu',
+  'objectid',
+  'SHAPE__Area',
+] as const satisfies ReadonlyArray<keyof ParcelRecord>;
+
+/**
+ * Rebuilds a header-keyed record for a row (used only for malformed rows)
+ */
+function rowToRecord(header: string[], row: string[]): Record<string, string> {
+  const record: Record<string, string> = {};
+  header.forEach((name, index) => {
+    record[name] = row[index] ?? '';
+  });
+  return record;
+}
+
 /**
  * Loads and parses Portsmouth parcel data from CSV file
  *
+ * Rows are parsed as arrays and read through a header index, so no
+ * per-row object is built for columns that are immediately copied out.
+ *
  * @param csvPath - Path to Portsmouth_Parcels.csv file
  * @returns Object with valid parcels and malformed row information
  * @throws Error only if file is missing or completely unparseable
@@ -43,11 +82,10 @@ export function loadParcels(csvPath: string): LoadParcelsResult {
     );
   }
 
-  // Parse CSV with csv-parse library
-  let records: Record<string, string>[];
+  // Parse CSV with csv-parse library (first row is the header)
+  let rows: string[][];
   try {
-    records = parse(fileContent, {
-      columns: true, // Use first row as column names
+    rows = parse(fileContent, {
       skip_empty_lines: true,
       trim: true,
       bom: true, // Handle BOM (Byte Order Mark) in UTF-8 files
@@ -58,6 +96,15 @@ export function loadParcels(csvPath: string): LoadParcelsResult {
     );
   }
 
+  // Map each ParcelRecord field to its column; duplicate headers resolve to
+  // the last column, as with csv-parse's `columns: true`
+  const header = rows[0] ?? [];
+  const columns = {} as Record<keyof ParcelRecord, number>;
+  for (const field of PARCEL_FIELDS) {
+    columns[field] = header.lastIndexOf(field);
+  }
+  const cell = (row: string[], field: keyof ParcelRecord): string => row[columns[field]] || '';
+
   // Validate and transform records
   const parcels: ParcelRecord[] = [];
   const malformedRows: Array<{
@@ -66,59 +113,61 @@ export function loadParcels(csvPath: string): LoadParcelsResult {
     rawData?: Record<string, string>;
   }> = [];
 
-  for (let i = 0; i < records.length; i++) {
-    const row = records[i];
+  for (let i = 1; i < rows.length; i++) {
+    const row = rows[i];
     if (!row) continue; // Skip undefined rows
 
-    const rowNumber = i + 2; // +2 because: 1-indexed + header row
+    const rowNumber = i + 1; // +1 because rows are 0-indexed and include the header
 
     // Validate required fields
-    if (!row['displayid'] || row['displayid'].trim() === '') {
+    const displayid = cell(row, 'displayid');
+    if (displayid.trim() === '') {
       malformedRows.push({
         rowNumber,
         error: "Missing required field 'displayid'",
-        rawData: row,
+        rawData: rowToRecord(header, row),
       });
       continue;
     }
 
-    if (!row['pid'] || row['pid'].trim() === '') {
+    const pid = cell(row, 'pid');
+    if (pid.trim() === '') {
       malformedRows.push({
         rowNumber,
-        error: `Missing required field 'pid' (Parcel ID: ${row['displayid']})`,
-        rawData: row,
+        error: `Missing required field 'pid' (Parcel ID: ${displayid})`,
+        rawData: rowToRecord(header, row),
       });
       continue;
     }
 
     // Create typed parcel record
     const parcel: ParcelRecord = {
-      town: row['town'] || '',
-      slum: row['slum'] || '',
-      localnbc: row['localnbc'] || '',
-      pid: row['pid'] || '',
-      townid: row['townid'] || '',
-      nbc: row['nbc'] || '',
-      oid_1: row['oid_1'] || '',
-      sluc: row['sluc'] || '',
-      u_id: row['u_id'] || '',
-      countyid: row['countyid'] || '',
-      name: row['name'] || '',
-      streetaddress: row['streetaddress'] || '',
-      parceloid: row['parceloid'] || '',
-      nh_gis_id: row['nh_gis_id'] || '',
-      displayid: row['displayid'] || '',
-      SHAPE__Length: row['SHAPE__Length'] || '',
-      slu: row['slu'] || '',
-      objectid: row['objectid'] || '',
-      SHAPE__Area: row['SHAPE__Area'] || '',
+      town: cell(row, 'town'),
+      slum: cell(row, 'slum'),
+      localnbc: cell(row, 'localnbc'),
+      pid,
+      townid: cell(row, 'townid'),
+      nbc: cell(row, 'nbc'),
+      oid_1: cell(row, 'oid_1'),
+      sluc: cell(row, 'sluc'),
+      u_id: cell(row, 'u_id'),
+      countyid: cell(row, 'countyid'),
+      name: cell(row, 'name'),
+      streetaddress: cell(row, 'streetaddress'),
+      parceloid: cell(row, 'parceloid'),
+      nh_gis_id: cell(row, 'nh_gis_id'),
+      displayid,
+      SHAPE__Length: cell(row, 'SHAPE__Length'),
+      slu: cell(row, 'slu'),
+      objectid: cell(row, 'objectid'),
+      SHAPE__Area: cell(row, 'SHAPE__Area'),
     };
 
     parcels.push(parcel);
   }
 
   // Report on parsing results - track malformed rows but don't fail
-  const totalRows = records.length;
+  const totalRows = Math.max(rows.length - 1, 0);
   console.log(`✓ Loaded ${parcels.length} valid parcels from ${totalRows} CSV rows`);
 
   if (malformedRows.length > 0) {
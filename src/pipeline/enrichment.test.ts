@@ -2,16 +2,18 @@
  * Integration tests for parallel enrichment pipeline
  *
  * Tests the complete data enrichment flow with sample data.
- * Note: VGSI integration is currently disabled.
+ * VGSI building data is disabled by default and covered separately.
  */
 
 import { describe, it, expect, beforeEach, vi } from 'vitest';
 import { EnrichmentPipeline } from './enrichment.js';
 import type { ParcelRecord, MapGeoResponse } from '../types/index.js';
 import { MapGeoClient } from '../api/mapgeo-client.js';
+import { VGSIClient } from '../api/vgsi-client.js';
 
-// Mock the API client
+// Mock the API clients
 vi.mock('../api/mapgeo-client.js');
+vi.mock('../api/vgsi-client.js');
 
 describe('EnrichmentPipeline', () => {
   let pipeline: EnrichmentPipeline;
@@ -166,6 +168,36 @@ describe('EnrichmentPipeline', () => {
     expect(fetchOrder[2]).toBe('003');
   });
 
+  it('should start the next parcel as soon as any worker is free', async () => {
+    // Arrange
+    const parcels = [
+      createSampleParcel('001'),
+      createSampleParcel('002'),
+      createSampleParcel('003'),
+    ];
+
+    const events: string[] = [];
+
+    mockMapGeoClient.fetchParcelData = vi
+      .fn()
+      .mockImplementation(async (parcelId: string) => {
+        events.push(`start:${parcelId}`);
+        // 001 is slow; 003 should not wait for it
+        await new Promise(resolve => setTimeout(resolve, parcelId === '001' ? 50 : 5));
+        events.push(`end:${parcelId}`);
+        return createMapGeoResponse(parcelId);
+      });
+
+    // Act
+    const result = await pipeline.enrichParcels(parcels);
+
+    // Assert
+    expect(events.indexOf('start:003')).toBeLessThan(events.indexOf('end:001'));
+
+    // Output order still follows input order
+    expect(result.parcels.map(p => p.parcel_id)).toEqual(['001', '002', '003']);
+  });
+
   it('should track all parcels and not lose any during processing', async () => {
     // Arrange
     const parcels = [
@@ -270,4 +302,94 @@ describe('EnrichmentPipeline', () => {
     expect(enriched.living_area_sqft).toBeUndefined();
     expect(enriched.lot_coverage_pct).toBe(0);
   });
+
+  describe('with VGSI building data enabled', () => {
+    let buildingPipeline: EnrichmentPipeline;
+    let buildingMapGeoClient: any;
+    let mockVGSIClient: any;
+
+    beforeEach(() => {
+      buildingPipeline = new EnrichmentPipeline({
+        batchSize: 2,
+        maxRequestsPerSecond: 10,
+        maxRetries: 3,
+        fetchBuildingData: true,
+      });
+
+      buildingMapGeoClient = vi.mocked(MapGeoClient).mock.instances.at(-1);
+      mockVGSIClient = vi.mocked(VGSIClient).mock.instances.at(-1);
+    });
+
+    const createParcelWithAccount = (id: string, account: string): ParcelRecord => ({
+      ...createSampleParcel(id),
+      u_id: `178-${account}`,
+    });
+
+    const createResponseWithAccount = (parcelId: string, account: string): MapGeoResponse => {
+      const response = createMapGeoResponse(parcelId);
+      response.data.account = account;
+      response.data.parcelArea = 0.5; // 21,780 sqft
+      return response;
+    };
+
+    it('should start the VGSI request before Map Geo resolves', async () => {
+      const parcels = [createParcelWithAccount('001', '32597')];
+      const events: string[] = [];
+
+      buildingMapGeoClient.fetchParcelData = vi.fn().mockImplementation(async (parcelId: string) => {
+        events.push('mapgeo:start');
+        await new Promise(resolve => setTimeout(resolve, 10));
+        events.push('mapgeo:end');
+        return createResponseWithAccount(parcelId, '32597');
+      });
+      mockVGSIClient.fetchPropertyData = vi.fn().mockImplementation(async () => {
+        events.push('vgsi:start');
+        return { living_area_sqft: 3000, building_footprint_sqft: 2178 };
+      });
+
+      const result = await buildingPipeline.enrichParcels(parcels);
+
+      expect(events.indexOf('vgsi:start')).toBeLessThan(events.indexOf('mapgeo:end'));
+      expect(mockVGSIClient.fetchPropertyData).toHaveBeenCalledTimes(1);
+      expect(mockVGSIClient.fetchPropertyData).toHaveBeenCalledWith('32597', '001');
+
+      const enriched = result.parcels[0]!;
+      expect(enriched.building_footprint_sqft).toBe(2178);
+      expect(enriched.living_area_sqft).toBe(3000);
+      expect(enriched.lot_coverage_pct).toBeCloseTo(10);
+    });
+
+    it('should refetch with the Map Geo account when it differs from the CSV', async () => {
+      const parcels = [createParcelWithAccount('001', '11111')];
+
+      buildingMapGeoClient.fetchParcelData = vi
+        .fn()
+        .mockResolvedValue(createResponseWithAccount('001', '22222'));
+      mockVGSIClient.fetchPropertyData = vi
+        .fn()
+        .mockResolvedValue({ living_area_sqft: 1500, building_footprint_sqft: 1500 });
+
+      await buildingPipeline.enrichParcels(parcels);
+
+      expect(mockVGSIClient.fetchPropertyData).toHaveBeenCalledTimes(2);
+      expect(mockVGSIClient.fetchPropertyData).toHaveBeenLastCalledWith('22222', '001');
+    });
+
+    it('should keep the parcel when VGSI data is unavailable', async () => {
+      const parcels = [createParcelWithAccount('001', '32597')];
+
+      buildingMapGeoClient.fetchParcelData = vi
+        .fn()
+        .mockResolvedValue(createResponseWithAccount('001', '32597'));
+      mockVGSIClient.fetchPropertyData = vi.fn().mockResolvedValue(null);
+
+      const result = await buildingPipeline.enrichParcels(parcels);
+
+      expect(result.errors).toHaveLength(0);
+      const enriched = result.parcels[0]!;
+      expect(enriched.building_footprint_sqft).toBe(0);
+      expect(enriched.living_area_sqft).toBeUndefined();
+      expect(enriched.lot_coverage_pct).toBe(0);
+    });
+  });
 });
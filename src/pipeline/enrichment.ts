@@ -2,8 +2,8 @@
  * Parallel Data Enrichment Pipeline
  *
  * Processes parcel records in parallel batches, enriching each with data
- * from the Map Geo API. Implements comprehensive error tracking and
- * progress reporting.
+ * from the Map Geo API and, optionally, building data from the VGSI API.
+ * Implements comprehensive error tracking and progress reporting.
  *
  * Core Principles:
  * - Process ALL parcels (no silent skipping)
@@ -17,11 +17,15 @@ import type {
   EnrichedParcel,
   APIError,
   MapGeoResponse,
+  VGSIResponse,
   EnrichmentResult,
 } from '../types/index.js';
 import { MapGeoClient } from '../api/mapgeo-client.js';
+import { ResponseCache } from '../api/response-cache.js';
+import { VGSIClient } from '../api/vgsi-client.js';
 import {
   validateMapGeoResponse,
+  validateVGSIResponse,
   validateEnrichedParcel,
 } from '../validators/data-validator.js';
 
@@ -46,6 +50,38 @@ export interface EnrichmentConfig {
    * @default 3
    */
   maxRetries?: number;
+
+  /**
+   * Fetch building measurements from the VGSI API
+   * @default false
+   */
+  fetchBuildingData?: boolean;
+
+  /**
+   * Directory for cached API responses; caching is disabled when unset
+   */
+  cacheDir?: string;
+}
+
+/**
+ * Result of enriching a single parcel
+ */
+type EnrichmentOutcome =
+  | { success: true; data: EnrichedParcel }
+  | { success: false; error: APIError };
+
+/**
+ * Derives the VGSI account number from a CSV u_id
+ *
+ * The u_id is the town code followed by the account (e.g. "178-32597"),
+ * which matches the Map Geo 'account' field.
+ *
+ * @param uid - u_id from the parcel CSV
+ * @returns Account number, or null if the u_id has no account segment
+ */
+function accountFromUid(uid: string): string | null {
+  const account = uid.slice(uid.lastIndexOf('-') + 1).trim();
+  return account === '' ? null : account;
 }
 
 /**
@@ -53,24 +89,56 @@ export interface EnrichmentConfig {
  *
  * Orchestrates the complete enrichment process:
  * 1. Fetches Map Geo data for each parcel
- * 2. Combines data into EnrichedParcel objects
- * 3. Validates output data quality
- * 4. Tracks all errors and failures
- *
- * Note: VGSI building data integration is disabled and will be added in a future update.
+ * 2. Fetches VGSI building data concurrently (when enabled)
+ * 3. Combines data into EnrichedParcel objects
+ * 4. Validates output data quality
+ * 5. Tracks all errors and failures
  */
 export class EnrichmentPipeline {
   private readonly mapGeoClient: MapGeoClient;
+  private readonly vgsiClient: VGSIClient | null;
   private readonly batchSize: number;
 
   constructor(config: EnrichmentConfig = {}) {
     this.batchSize = config.batchSize ?? 5;
 
-    // Initialize API client with shared config
-    this.mapGeoClient = new MapGeoClient({
+    // Initialize API clients with shared config
+    const clientConfig = {
       maxRequestsPerSecond: config.maxRequestsPerSecond ?? 10,
       maxRetries: config.maxRetries ?? 3,
-    });
+    };
+    const cache = config.cacheDir ? new ResponseCache({ cacheDir: config.cacheDir }) : undefined;
+    this.mapGeoClient = new MapGeoClient({ ...clientConfig, cache });
+    this.vgsiClient = config.fetchBuildingData ? new VGSIClient({ ...clientConfig, cache }) : null;
+  }
+
+  /**
+   * Fetches and validates VGSI building data for a parcel
+   *
+   * Building data is optional: vacant lots have none, and a VGSI failure
+   * must not fail the parcel. Any failure resolves to null.
+   *
+   * @param accountNumber - VGSI account number
+   * @param parcelId - Parcel ID the data is for
+   * @returns Building data, or null if unavailable
+   */
+  private async fetchBuildingData(
+    accountNumber: string,
+    parcelId: string
+  ): Promise<VGSIResponse | null> {
+    if (!this.vgsiClient) {
+      return null;
+    }
+
+    try {
+      const buildingData = await this.vgsiClient.fetchPropertyData(accountNumber, parcelId);
+      if (!buildingData || validateVGSIResponse(buildingData, parcelId).length > 0) {
+        return null;
+      }
+      return buildingData;
+    } catch {
+      return null;
+    }
   }
 
   /**
@@ -80,17 +148,24 @@ export class EnrichmentPipeline {
    * All errors are captured and returned as APIError objects to ensure
    * no parcels are silently lost during processing.
    *
-   * Note: Building data from VGSI is not currently integrated.
+   * When building data is enabled, the VGSI request is started alongside
+   * the Map Geo request using the account from the CSV u_id, so the two
+   * round trips overlap. If Map Geo reports a different account, VGSI is
+   * queried again with the Map Geo account.
    *
    * @param parcel - Base parcel record from CSV
    * @returns Enriched parcel data OR error object
    */
   private async enrichParcel(
     parcel: ParcelRecord
-  ): Promise<{ success: true; data: EnrichedParcel } | { success: false; error: APIError }> {
+  ): Promise<EnrichmentOutcome> {
     const parcelId = parcel.displayid;
 
     try {
+      // Start the VGSI lookup now rather than waiting on Map Geo for the account
+      const csvAccount = this.vgsiClient ? accountFromUid(parcel.u_id) : null;
+      const earlyBuildingData = csvAccount ? this.fetchBuildingData(csvAccount, parcelId) : null;
+
       // Step 1: Fetch Map Geo data (geographic and property info)
       let mapGeoData: MapGeoResponse;
       try {
@@ -116,10 +191,21 @@ export class EnrichmentPipeline {
         };
       }
 
-      // Step 2: Combine all data into EnrichedParcel object
-      const enrichedParcel = this.combineParcelData(parcel, mapGeoData);
+      // Step 2: Resolve VGSI building data (optional, never fails the parcel)
+      let buildingData: VGSIResponse | null = null;
+      if (this.vgsiClient) {
+        const mapGeoAccount = mapGeoData.data.account;
+        if (earlyBuildingData && (!mapGeoAccount || mapGeoAccount === csvAccount)) {
+          buildingData = await earlyBuildingData;
+        } else if (mapGeoAccount) {
+          buildingData = await this.fetchBuildingData(mapGeoAccount, parcelId);
+        }
+      }
 
-      // Step 3: Validate final enriched parcel
+      // Step 3: Combine all data into EnrichedParcel object
+      const enrichedParcel = this.combineParcelData(parcel, mapGeoData, buildingData);
+
+      // Step 4: Validate final enriched parcel
       const finalValidationErrors = validateEnrichedParcel(enrichedParcel as unknown as Record<string, unknown>);
       if (finalValidationErrors.length > 0) {
         throw new Error(
@@ -149,16 +235,18 @@ export class EnrichmentPipeline {
    * Handles type conversions, defaults, and calculations.
    * Ensures all fields have valid values.
    *
-   * Note: Building measurements (footprint, living area, lot coverage) are set to 0/undefined
-   * until VGSI integration is added.
+   * Building measurements (footprint, living area, lot coverage) are set to 0/undefined
+   * when no VGSI data is available.
    *
    * @param parcel - Base parcel record from CSV
    * @param mapGeoData - Data from Map Geo API
+   * @param buildingData - Data from VGSI API, if fetched
    * @returns Complete enriched parcel object
    */
   private combineParcelData(
     parcel: ParcelRecord,
-    mapGeoData: MapGeoResponse
+    mapGeoData: MapGeoResponse,
+    buildingData: VGSIResponse | null = null
   ): EnrichedParcel {
     const data = mapGeoData.data;
 
@@ -168,10 +256,13 @@ export class EnrichmentPipeline {
     const parcelAreaAcres = this.parseNumber(data.parcelArea, 0); // MapGeo API returns acres
     const parcelAreaSqft = parcelAreaAcres * 43560; // Convert acres to sqft
 
-    // Building measurements - not available without VGSI integration
-    const buildingFootprint = 0;
-    const livingArea = undefined;
-    const lotCoveragePct = 0;
+    // Building measurements - only available from VGSI
+    const buildingFootprint = buildingData?.building_footprint_sqft ?? 0;
+    const livingArea = buildingData?.living_area_sqft;
+    const lotCoveragePct =
+      buildingFootprint > 0 && parcelAreaSqft > 0
+        ? (buildingFootprint / parcelAreaSqft) * 100
+        : 0;
 
     // Build enriched parcel object
     const enriched: EnrichedParcel = {
@@ -192,7 +283,7 @@ export class EnrichmentPipeline {
       parcel_area_acres: parcelAreaAcres,
       parcel_area_sqft: parcelAreaSqft,
 
-      // Building information (VGSI data - not currently available)
+      // Building information (VGSI data)
       building_footprint_sqft: buildingFootprint,
       living_area_sqft: livingArea,
       lot_coverage_pct: lotCoveragePct,
@@ -220,7 +311,8 @@ export class EnrichmentPipeline {
     }
 
     if (typeof value === 'string') {
-      const cleaned = value.replace(/,/g, '');
+      // Only strings carrying thousands separators need cleaning
+      const cleaned = value.includes(',') ? value.replaceAll(',', '') : value;
       const parsed = parseFloat(cleaned);
       return isNaN(parsed) ? defaultValue : parsed;
     }
@@ -229,7 +321,11 @@ export class EnrichmentPipeline {
   }
 
   /**
-   * Processes parcels in parallel batches
+   * Processes parcels with a fixed pool of concurrent workers
+   *
+   * `batchSize` workers each take the next unprocessed parcel as soon as
+   * their previous one finishes, so one slow request no longer holds up
+   * the rest of its batch. Results are kept in input order.
    *
    * CRITICAL: This method ensures ALL parcels are processed.
    * - Successful enrichments are added to results
@@ -245,44 +341,48 @@ export class EnrichmentPipeline {
 
     console.log(`\n=== Starting Parallel Enrichment Pipeline ===`);
     console.log(`Total parcels to process: ${totalParcels}`);
-    console.log(`Batch size: ${this.batchSize}`);
+    console.log(`Concurrent workers: ${this.batchSize}`);
     console.log(`Starting at: ${new Date().toISOString()}`);
 
-    const enrichedParcels: EnrichedParcel[] = [];
-    const errors: APIError[] = [];
+    const results: EnrichmentOutcome[] = new Array(totalParcels);
+    let nextIndex = 0;
     let processedCount = 0;
+    let successCount = 0;
 
-    // Process parcels in batches for parallel execution
-    for (let i = 0; i < parcels.length; i += this.batchSize) {
-      const batch = parcels.slice(i, i + this.batchSize);
-      const batchNumber = Math.floor(i / this.batchSize) + 1;
-      const totalBatches = Math.ceil(parcels.length / this.batchSize);
+    const worker = async (): Promise<void> => {
+      while (nextIndex < totalParcels) {
+        const index = nextIndex++;
+        const result = await this.enrichParcel(parcels[index]!);
+        results[index] = result;
 
-      console.log(`\nProcessing batch ${batchNumber}/${totalBatches} (${batch.length} parcels)...`);
+        processedCount++;
+        if (result.success) {
+          successCount++;
+        }
 
-      // Process all parcels in the batch concurrently
-      const batchPromises = batch.map(parcel => this.enrichParcel(parcel));
-      const batchResults = await Promise.all(batchPromises);
+        // Log progress every batchSize parcels and at the end
+        if (processedCount % this.batchSize === 0 || processedCount === totalParcels) {
+          const percentComplete = ((processedCount / totalParcels) * 100).toFixed(1);
 
-      // Sort results into successes and failures
-      for (const result of batchResults) {
-        if (result.success) {
-          enrichedParcels.push(result.data);
-        } else {
-          errors.push(result.error);
+          console.log(`Progress: ${processedCount}/${totalParcels} (${percentComplete}%)`);
+          console.log(`  ✓ Successful: ${successCount}`);
+          console.log(`  ✗ Failed: ${processedCount - successCount}`);
         }
       }
+    };
 
-      processedCount += batch.length;
-
-      // Log progress
-      const successCount = enrichedParcels.length;
-      const errorCount = errors.length;
-      const percentComplete = ((processedCount / totalParcels) * 100).toFixed(1);
+    const workerCount = Math.min(this.batchSize, totalParcels);
+    await Promise.all(Array.from({ length: workerCount }, worker));
 
-      console.log(`Progress: ${processedCount}/${totalParcels} (${percentComplete}%)`);
-      console.log(`  ✓ Successful: ${successCount}`);
-      console.log(`  ✗ Failed: ${errorCount}`);
+    // Sort results into successes and failures
+    const enrichedParcels: EnrichedParcel[] = [];
+    const errors: APIError[] = [];
+    for (const result of results) {
+      if (result.success) {
+        enrichedParcels.push(result.data);
+      } else {
+        errors.push(result.error);
+      }
     }
 
     const endTime = Date.now();
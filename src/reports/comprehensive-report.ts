@@ -9,6 +9,37 @@ import { ZONING_RULES } from '../zoning/rules.js';
 import type { ZoneMetrics } from '../analysis/zone-metrics.js';
 import type { ViolationsAnalysis } from '../analysis/violations.js';
 
+const RULE = '='.repeat(80);
+const THIN_RULE = '─'.repeat(80);
+
+/**
+ * Static summary of key ordinance requirements, appended to every report
+ */
+const DIMENSIONAL_REQUIREMENTS: readonly string[] = [
+  'Residential Zones:',
+  '  R:   Minimum 217,800 sf (5 acres), Max 5% coverage',
+  '  SRA: Minimum 43,560 sf (1 acre), Max 10% coverage',
+  '  SRB: Minimum 15,000 sf, Max 20% coverage',
+  '  GRA: Minimum 7,500 sf, Max 25% coverage',
+  '  GRB: Minimum 5,000 sf, Max 30% coverage',
+  '  GRC: Minimum 3,500 sf, Max 35% coverage',
+  '',
+  'Business Zones:',
+  '  B/WB: Minimum 20,000 sf, Max 30-35% coverage',
+  '  GB/G1/G2: Minimum 43,560 sf (1 acre), Max 30% coverage',
+  '',
+  'Industrial Zones:',
+  '  I/WI: Minimum 87,120 sf (2 acres), Max 50% coverage',
+  '  OR: Minimum 130,680 sf (3 acres), Max 30% coverage',
+];
+
+/**
+ * Display name for a zone code, falling back to the code for unknown zones
+ */
+function getZoneName(zone: string): string {
+  return ZONING_RULES[zone]?.name || zone;
+}
+
 /**
  * Generate comprehensive zoning analysis report
  *
@@ -27,9 +58,7 @@ export function generateComprehensiveReport(
   const lines: string[] = [];
 
   // Header
-  lines.push('='.repeat(80));
-  lines.push('PORTSMOUTH NH COMPREHENSIVE ZONING ANALYSIS REPORT');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'PORTSMOUTH NH COMPREHENSIVE ZONING ANALYSIS REPORT', RULE);
   lines.push(`Generated: ${timestamp}`);
   lines.push('Based on: Portsmouth Zoning Ordinance (Amended through May 5, 2025)');
   lines.push('Source: https://files.portsmouthnh.gov/files/planning/ZoningOrd-250505+ADOPTED.pdf');
@@ -45,9 +74,7 @@ export function generateComprehensiveReport(
   lines.push('');
 
   // Land Distribution
-  lines.push('='.repeat(80));
-  lines.push('LAND DISTRIBUTION BY ZONE');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'LAND DISTRIBUTION BY ZONE', RULE);
 
   const sortedByLand = Object.entries(zoneMetrics.zones).sort(
     ([, a], [, b]) => {
@@ -58,7 +85,7 @@ export function generateComprehensiveReport(
   );
 
   for (const [zone, data] of sortedByLand) {
-    const zoneName = ZONING_RULES[zone]?.name || zone;
+    const zoneName = getZoneName(zone);
     const pctOfLand = totalAcres > 0 ? (data.totalAcres / totalAcres) * 100 : 0;
     lines.push('');
     lines.push(`${zone} - ${zoneName}`);
@@ -70,16 +97,14 @@ export function generateComprehensiveReport(
 
   // Tax Revenue
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('TAX REVENUE ANALYSIS BY ZONE');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'TAX REVENUE ANALYSIS BY ZONE', RULE);
 
   const sortedByValue = Object.entries(zoneMetrics.zones).sort(
     ([, a], [, b]) => b.totalValue - a.totalValue
   );
 
   for (const [zone, data] of sortedByValue.slice(0, 15)) {
-    const zoneName = ZONING_RULES[zone]?.name || zone;
+    const zoneName = getZoneName(zone);
     lines.push('');
     lines.push(`${zone} - ${zoneName}`);
     lines.push(`  Total Value: $${data.totalValue.toLocaleString(undefined, { maximumFractionDigits: 0 })}`);
@@ -91,9 +116,7 @@ export function generateComprehensiveReport(
 
   if (zoneMetrics.mostRevenueDenseZone) {
     lines.push('');
-    lines.push('─'.repeat(80));
-    lines.push('MOST REVENUE-DENSE ZONE');
-    lines.push('─'.repeat(80));
+    lines.push(THIN_RULE, 'MOST REVENUE-DENSE ZONE', THIN_RULE);
     lines.push(`Zone: ${zoneMetrics.mostRevenueDenseZone.zone}`);
     lines.push(
       `Revenue per Acre: $${zoneMetrics.mostRevenueDenseZone.revenueDensity.toLocaleString(undefined, { maximumFractionDigits: 0 })}`
@@ -102,9 +125,7 @@ export function generateComprehensiveReport(
 
   // Violations
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('ZONING VIOLATIONS ANALYSIS');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'ZONING VIOLATIONS ANALYSIS', RULE);
   lines.push(`Total Violations Found: ${violationsAnalysis.total_violations.toLocaleString()}`);
   lines.push(`Total Parcels with Violations: ${violationsAnalysis.total_parcels_with_violations.toLocaleString()}`);
   lines.push('');
@@ -127,7 +148,7 @@ export function generateComprehensiveReport(
     });
 
   for (const { zone, data, totalParcels } of zonesWithViolations) {
-    const zoneName = ZONING_RULES[zone]?.name || zone;
+    const zoneName = getZoneName(zone);
     const violationRate = totalParcels > 0 ? (data.parcels_with_violations.length / totalParcels) * 100 : 0;
 
     lines.push('');
@@ -173,9 +194,7 @@ export function generateComprehensiveReport(
 
   // Summary statistics
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('VIOLATION SUMMARY STATISTICS');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'VIOLATION SUMMARY STATISTICS', RULE);
   lines.push('');
   lines.push(`Total Undersized Lots: ${violationsAnalysis.violation_type_summary.undersized_lot.toLocaleString()}`);
   lines.push(
@@ -188,31 +207,13 @@ export function generateComprehensiveReport(
 
   // Key dimensional requirements
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('KEY DIMENSIONAL REQUIREMENTS (from Official Ordinance)');
-  lines.push('='.repeat(80));
-  lines.push('');
-  lines.push('Residential Zones:');
-  lines.push('  R:   Minimum 217,800 sf (5 acres), Max 5% coverage');
-  lines.push('  SRA: Minimum 43,560 sf (1 acre), Max 10% coverage');
-  lines.push('  SRB: Minimum 15,000 sf, Max 20% coverage');
-  lines.push('  GRA: Minimum 7,500 sf, Max 25% coverage');
-  lines.push('  GRB: Minimum 5,000 sf, Max 30% coverage');
-  lines.push('  GRC: Minimum 3,500 sf, Max 35% coverage');
-  lines.push('');
-  lines.push('Business Zones:');
-  lines.push('  B/WB: Minimum 20,000 sf, Max 30-35% coverage');
-  lines.push('  GB/G1/G2: Minimum 43,560 sf (1 acre), Max 30% coverage');
+  lines.push(RULE, 'KEY DIMENSIONAL REQUIREMENTS (from Official Ordinance)', RULE);
   lines.push('');
-  lines.push('Industrial Zones:');
-  lines.push('  I/WI: Minimum 87,120 sf (2 acres), Max 50% coverage');
-  lines.push('  OR: Minimum 130,680 sf (3 acres), Max 30% coverage');
+  lines.push(...DIMENSIONAL_REQUIREMENTS);
 
   // Footer
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('END OF REPORT');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'END OF REPORT', RULE);
 
   return lines.join('\n');
 }
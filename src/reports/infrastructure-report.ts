@@ -5,7 +5,33 @@
  * of different zoning patterns based on infrastructure burden.
  */
 
-import { InfrastructureMetrics } from '../analysis/infrastructure-burden.js';
+import {
+  MULTI_FAMILY_ZONES,
+  SINGLE_FAMILY_ZONES,
+  type AggregateMetrics,
+  type InfrastructureMetrics,
+} from '../analysis/infrastructure-burden.js';
+
+const RULE = '='.repeat(80);
+const THIN_RULE = '─'.repeat(80);
+
+/**
+ * Append the summary block for one group of residential zones
+ */
+function pushAggregateSection(
+  lines: string[],
+  heading: string,
+  zones: readonly string[],
+  aggregate: AggregateMetrics
+): void {
+  lines.push('');
+  lines.push(`${heading} (${zones.join(', ')}):`);
+  lines.push(`  Revenue per Parcel: $${aggregate.revenue_per_parcel.toLocaleString()}`);
+  lines.push(`  Revenue per Acre: $${aggregate.revenue_per_acre.toLocaleString()}`);
+  lines.push(`  Infrastructure per Parcel: ${aggregate.infrastructure_per_parcel.toLocaleString()} linear feet`);
+  lines.push(`  Est. Infrastructure Cost per Parcel: $${aggregate.cost_per_parcel.toLocaleString()}`);
+  lines.push(`  Fiscal Sustainability Ratio: ${aggregate.fiscal_ratio.toFixed(2)}`);
+}
 
 /**
  * Generate infrastructure burden analysis report
@@ -17,9 +43,7 @@ export function generateInfrastructureReport(
   const lines: string[] = [];
 
   // Header
-  lines.push('='.repeat(80));
-  lines.push('PORTSMOUTH INFRASTRUCTURE BURDEN & FISCAL SUSTAINABILITY ANALYSIS');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'PORTSMOUTH INFRASTRUCTURE BURDEN & FISCAL SUSTAINABILITY ANALYSIS', RULE);
   lines.push('');
   lines.push('This analysis examines the relationship between zoning density, tax revenue,');
   lines.push('and estimated municipal service costs.');
@@ -29,17 +53,11 @@ export function generateInfrastructureReport(
   lines.push('');
 
   // Residential zones analysis
-  const residentialZones = ['R', 'SRA', 'SRB', 'GRA', 'GRB', 'GRC'];
+  const residentialZones = [...SINGLE_FAMILY_ZONES, ...MULTI_FAMILY_ZONES];
 
-  lines.push('='.repeat(80));
-  lines.push('RESIDENTIAL ZONE INFRASTRUCTURE ANALYSIS');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'RESIDENTIAL ZONE INFRASTRUCTURE ANALYSIS', RULE);
 
   for (const zone of residentialZones) {
-    if (!(zone in infrastructureMetrics.zones)) {
-      continue;
-    }
-
     const data = infrastructureMetrics.zones[zone];
     if (!data) {
       continue;
@@ -47,7 +65,7 @@ export function generateInfrastructureReport(
 
     lines.push('');
     lines.push(`${zone} - ${data.zone_name}`);
-    lines.push('─'.repeat(80));
+    lines.push(THIN_RULE);
 
     lines.push('');
     lines.push('Basic Metrics:');
@@ -97,33 +115,16 @@ export function generateInfrastructureReport(
 
   // Comparative analysis
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('COMPARATIVE ANALYSIS: SINGLE-FAMILY vs MULTI-FAMILY ZONES');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'COMPARATIVE ANALYSIS: SINGLE-FAMILY vs MULTI-FAMILY ZONES', RULE);
 
   const sf = infrastructureMetrics.single_family_aggregate;
   const mf = infrastructureMetrics.multi_family_aggregate;
 
-  lines.push('');
-  lines.push('SINGLE-FAMILY ONLY ZONES (R, SRA, SRB):');
-  lines.push(`  Revenue per Parcel: $${sf.revenue_per_parcel.toLocaleString()}`);
-  lines.push(`  Revenue per Acre: $${sf.revenue_per_acre.toLocaleString()}`);
-  lines.push(`  Infrastructure per Parcel: ${sf.infrastructure_per_parcel.toLocaleString()} linear feet`);
-  lines.push(`  Est. Infrastructure Cost per Parcel: $${sf.cost_per_parcel.toLocaleString()}`);
-  lines.push(`  Fiscal Sustainability Ratio: ${sf.fiscal_ratio.toFixed(2)}`);
-
-  lines.push('');
-  lines.push('MULTI-FAMILY ALLOWED ZONES (GRA, GRB, GRC):');
-  lines.push(`  Revenue per Parcel: $${mf.revenue_per_parcel.toLocaleString()}`);
-  lines.push(`  Revenue per Acre: $${mf.revenue_per_acre.toLocaleString()}`);
-  lines.push(`  Infrastructure per Parcel: ${mf.infrastructure_per_parcel.toLocaleString()} linear feet`);
-  lines.push(`  Est. Infrastructure Cost per Parcel: $${mf.cost_per_parcel.toLocaleString()}`);
-  lines.push(`  Fiscal Sustainability Ratio: ${mf.fiscal_ratio.toFixed(2)}`);
+  pushAggregateSection(lines, 'SINGLE-FAMILY ONLY ZONES', SINGLE_FAMILY_ZONES, sf);
+  pushAggregateSection(lines, 'MULTI-FAMILY ALLOWED ZONES', MULTI_FAMILY_ZONES, mf);
 
   lines.push('');
-  lines.push('─'.repeat(80));
-  lines.push('DIRECT COMPARISON:');
-  lines.push('─'.repeat(80));
+  lines.push(THIN_RULE, 'DIRECT COMPARISON:', THIN_RULE);
 
   const infrastructureRatio = mf.infrastructure_per_parcel > 0
     ? sf.infrastructure_per_parcel / mf.infrastructure_per_parcel
@@ -144,9 +145,7 @@ export function generateInfrastructureReport(
 
   // Key findings
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('KEY FINDINGS');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'KEY FINDINGS', RULE);
 
   lines.push('');
   lines.push('1. INFRASTRUCTURE BURDEN:');
@@ -179,9 +178,7 @@ export function generateInfrastructureReport(
 
   // Methodology notes
   lines.push('');
-  lines.push('='.repeat(80));
-  lines.push('METHODOLOGY NOTES');
-  lines.push('='.repeat(80));
+  lines.push(RULE, 'METHODOLOGY NOTES', RULE);
   lines.push('');
   lines.push('Infrastructure cost estimates based on:');
   lines.push('• Minimum lot frontage requirements (linear feet per parcel)');
@@ -196,9 +193,7 @@ export function generateInfrastructureReport(
   lines.push('• >50 = strong fiscal contributor');
 
   lines.push('');
-  lines.push('─'.repeat(80));
-  lines.push(`Report generated: ${timestamp}`);
-  lines.push('─'.repeat(80));
+  lines.push(THIN_RULE, `Report generated: ${timestamp}`, THIN_RULE);
 
   return lines.join('\n');
 }
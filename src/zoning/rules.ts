@@ -479,8 +479,29 @@ const LAND_USE_CLASSIFICATIONS: Record<string, LandUseType> = {
   'MIXED USE': 'mixed_use',
 };
 
+/**
+ * Classification keywords in priority order, matched in a single regex scan
+ */
+const LAND_USE_KEYWORDS = Object.keys(LAND_USE_CLASSIFICATIONS);
+const LAND_USE_PATTERN = new RegExp(
+  LAND_USE_KEYWORDS.map(key => key.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'),
+  'g'
+);
+
+/**
+ * Classifications by raw description. Parcel data uses a small vocabulary
+ * of descriptions, so nearly every call is a cache hit.
+ */
+const LAND_USE_CACHE_LIMIT = 512;
+const landUseCache = new Map<string, LandUseType>();
+
 /**
  * Classify land use description into standard categories
+ *
+ * When a description contains several keywords, the one listed first in
+ * LAND_USE_CLASSIFICATIONS wins, regardless of where it appears.
+ * Results are memoized per description.
+ *
  * @param landUseDesc - Land use description string from parcel data
  * @returns Standardized land use type
  */
@@ -489,11 +510,37 @@ export function classifyLandUse(landUseDesc: string | null | undefined): LandUse
     return 'unknown';
   }
 
-  const landUseUpper = landUseDesc.toUpperCase();
-  for (const [key, value] of Object.entries(LAND_USE_CLASSIFICATIONS)) {
-    if (landUseUpper.includes(key)) {
-      return value;
+  let landUse = landUseCache.get(landUseDesc);
+  if (landUse === undefined) {
+    landUse = matchLandUse(landUseDesc);
+
+    // Evict the oldest entry once full
+    if (landUseCache.size >= LAND_USE_CACHE_LIMIT) {
+      const oldest = landUseCache.keys().next();
+      if (!oldest.done) {
+        landUseCache.delete(oldest.value);
+      }
     }
+    landUseCache.set(landUseDesc, landUse);
   }
-  return 'other';
+  return landUse;
+}
+
+/**
+ * Finds the highest-priority classification keyword in a description
+ */
+function matchLandUse(landUseDesc: string): LandUseType {
+  const landUseUpper = landUseDesc.toUpperCase();
+  let best = LAND_USE_KEYWORDS.length;
+
+  // Step one character past each hit so overlapping keywords are still seen
+  LAND_USE_PATTERN.lastIndex = 0;
+  let match: RegExpExecArray | null;
+  while (best > 0 && (match = LAND_USE_PATTERN.exec(landUseUpper)) !== null) {
+    best = Math.min(best, LAND_USE_KEYWORDS.indexOf(match[0]));
+    LAND_USE_PATTERN.lastIndex = match.index + 1;
+  }
+
+  const key = LAND_USE_KEYWORDS[best];
+  return key === undefined ? 'other' : (LAND_USE_CLASSIFICATIONS[key] ?? 'other');
 }